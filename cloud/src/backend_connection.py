@@ -0,0 +1,334 @@
+"""
+Persistent WebSocket connection to the Mac translation backend.
+Keeps one connection open across translation requests instead of
+reconnecting for every utterance or voice message.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from wire_codecs import json_dumps, json_loads
+
+try:
+    # Cython WebSocket client, noticeably cheaper per request/response than
+    # the pure-Python websockets framing
+    from picows import WSCloseCode, WSListener, WSMsgType, ws_connect
+    PICOWS_AVAILABLE = True
+except ImportError:
+    PICOWS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Raised when a reused connection turns out to be closed
+CONNECTION_CLOSED_ERRORS = (ConnectionClosed, ConnectionResetError)
+
+
+if PICOWS_AVAILABLE:
+
+    class _PicowsListener(WSListener):
+        """Reassembles picows frames into whole messages on a queue."""
+
+        def __init__(self):
+            self.messages: asyncio.Queue = asyncio.Queue()
+            self._fragments: list[bytes] = []
+            self._msg_type = None
+
+        def on_ws_frame(self, transport, frame):
+            msg_type = frame.msg_type
+
+            if msg_type == WSMsgType.CLOSE:
+                transport.send_close(frame.get_close_code())
+                transport.disconnect()
+                return
+            if msg_type == WSMsgType.PING:
+                transport.send_pong(frame.get_payload_as_bytes())
+                return
+
+            if msg_type == WSMsgType.CONTINUATION:
+                self._fragments.append(frame.get_payload_as_bytes())
+            elif msg_type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                self._msg_type = msg_type
+                self._fragments = [frame.get_payload_as_bytes()]
+            else:
+                return
+
+            if frame.fin:
+                payload = b"".join(self._fragments)
+                self._fragments = []
+                if self._msg_type == WSMsgType.TEXT:
+                    self.messages.put_nowait(payload.decode("utf-8"))
+                else:
+                    self.messages.put_nowait(payload)
+
+        def on_ws_disconnected(self, transport):
+            # Wake any pending recv()
+            self.messages.put_nowait(None)
+
+
+class _PicowsConnection:
+    """Adapts a picows transport to the send/recv/close subset of websockets."""
+
+    def __init__(self, transport, listener):
+        self._transport = transport
+        self._listener = listener
+
+    async def send(self, message):
+        if isinstance(message, str):
+            self._transport.send(WSMsgType.TEXT, message.encode("utf-8"))
+        else:
+            self._transport.send(WSMsgType.BINARY, message)
+
+    async def recv(self):
+        message = await self._listener.messages.get()
+        if message is None:
+            self._listener.messages.put_nowait(None)
+            raise ConnectionResetError("Mac backend closed the connection")
+        return message
+
+    async def close(self):
+        self._transport.send_close(WSCloseCode.OK)
+        self._transport.disconnect()
+        await asyncio.wait_for(self._transport.wait_disconnected(), timeout=10)
+
+
+async def _ws_connect(url: str):
+    """
+    Open a WebSocket to the backend, preferring picows when installed.
+
+    Args:
+        url: WebSocket URL
+
+    Returns:
+        Connection exposing async send(), recv() and close()
+    """
+    if PICOWS_AVAILABLE:
+        transport, listener = await asyncio.wait_for(
+            ws_connect(
+                _PicowsListener,
+                url,
+                enable_auto_ping=True,
+                auto_ping_idle_timeout=20,  # Send ping after 20 idle seconds
+                auto_ping_reply_timeout=60,  # Drop connection if no pong in 60 seconds
+            ),
+            timeout=10,
+        )
+        return _PicowsConnection(transport, listener)
+
+    return await websockets.connect(
+        url,
+        open_timeout=10,
+        close_timeout=10,
+        ping_timeout=60,  # Keep connection alive for up to 60 seconds
+        ping_interval=20,  # Send ping every 20 seconds
+    )
+
+
+class BackendConnection:
+    """
+    Long-lived connection to the Mac backend's /ws/translate endpoint.
+
+    The connection is opened on first use and reused afterwards. Each request
+    carries a request_id; a background reader matches responses to the
+    waiting callers, so concurrent requests share the socket without waiting
+    for each other's round-trip. Failed connection attempts back off
+    exponentially so an offline backend isn't redialed on every message.
+    """
+
+    MAX_BACKOFF_S = 30.0
+    RESPONSE_TIMEOUT_S = 120.0  # STT + translation + TTS of a long utterance
+
+    def __init__(self, url: str):
+        """
+        Initialize backend connection.
+
+        Args:
+            url: WebSocket URL of Mac backend
+        """
+        self.url = url
+        self._ws = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._lock = asyncio.Lock()  # Serializes dialing and header+audio sends
+        self._backoff = 0.0
+        self._retry_at = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Whether a connection to the backend is currently open."""
+        return self._ws is not None
+
+    async def connect(self):
+        """
+        Return the open connection, dialing the backend if needed.
+
+        Returns:
+            Connected WebSocket
+
+        Raises:
+            ConnectionError: If still backing off from a failed attempt
+        """
+        async with self._lock:
+            return await self._connect()
+
+    async def _connect(self):
+        """Dial the backend if needed; caller must hold the lock."""
+        if self._ws is not None:
+            return self._ws
+
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise ConnectionError(
+                f"Mac backend unreachable, retrying in {self._retry_at - now:.0f}s"
+            )
+
+        logger.info(f"Connecting to Mac backend at {self.url}")
+        try:
+            ws = await _ws_connect(self.url)
+        except Exception:
+            self._backoff = min(self._backoff * 2 or 1.0, self.MAX_BACKOFF_S)
+            self._retry_at = time.monotonic() + self._backoff
+            raise
+
+        self._backoff = 0.0
+        self._ws = ws
+        # Requests in flight belong to the connection they were sent on
+        self._pending = {}
+        self._reader_task = asyncio.create_task(self._read_responses(ws, self._pending))
+        logger.info("✅ Connected to Mac backend")
+        return ws
+
+    async def keep_connected(self):
+        """
+        Keep the connection open, redialing whenever it drops.
+
+        Runs until cancelled; start it as a background task so requests find
+        a warm connection instead of paying the handshake themselves.
+        """
+        while True:
+            try:
+                await self.connect()
+            except Exception as e:
+                logger.warning(f"Mac backend connection failed: {e}")
+
+            reader = self._reader_task
+            if self._ws is not None and reader is not None:
+                # The reader exits when the connection drops
+                await asyncio.wait({reader})
+
+            await asyncio.sleep(max(self._retry_at - time.monotonic(), 1.0))
+
+    async def translate(self, request: dict, audio: bytes) -> Tuple[dict, Optional[bytes]]:
+        """
+        Send one translation request and wait for its response.
+
+        Args:
+            request: Request header (source_lang, target_lang, format)
+            audio: Raw audio to translate
+
+        Returns:
+            Tuple of (response metadata, translated audio or None on error)
+
+        Raises:
+            TimeoutError: If no response arrives within RESPONSE_TIMEOUT_S
+        """
+        try:
+            return await self._request(request, audio)
+        except CONNECTION_CLOSED_ERRORS:
+            # Reused connection went stale (backend restart, idle drop) - redial once
+            logger.warning("Mac backend connection closed, reconnecting")
+            return await self._request(request, audio)
+
+    async def _request(self, request: dict, audio: bytes) -> Tuple[dict, Optional[bytes]]:
+        """Send a request on the shared connection and await its response."""
+        request_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+
+        async with self._lock:
+            ws = await self._connect()
+            pending = self._pending
+            pending[request_id] = future
+            try:
+                # Send request header, then raw audio as a binary frame
+                await ws.send(json_dumps({
+                    **request,
+                    "request_id": request_id,
+                    "audio_bytes": len(audio),
+                }))
+                await ws.send(audio)
+            except BaseException:
+                # A half-sent request leaves the backend waiting for audio,
+                # so never reuse the socket
+                pending.pop(request_id, None)
+                await self._discard(ws)
+                raise
+
+        try:
+            # Bounded, so a backend that never answers (or doesn't echo
+            # request_id) can't hang the caller
+            return await asyncio.wait_for(future, self.RESPONSE_TIMEOUT_S)
+        finally:
+            # Late responses for abandoned requests are read and dropped
+            pending.pop(request_id, None)
+
+    async def _read_responses(self, ws, pending: Dict[str, asyncio.Future]):
+        """
+        Read responses off a connection and resolve the matching requests.
+
+        Args:
+            ws: Connection to read from
+            pending: In-flight requests on this connection, by request_id
+        """
+        try:
+            while True:
+                # The header frame is small now that audio travels in its own
+                # binary frame, so it is parsed straight off recv()
+                response = json_loads(await ws.recv())
+
+                translated_audio = None
+                if response.get("status") == "success":
+                    # Translated audio follows as a binary frame
+                    translated_audio = await ws.recv()
+
+                # Only an echoed request_id identifies the reply; guessing by
+                # order would hand an abandoned request's late reply to the
+                # next caller
+                future = pending.pop(response.get("request_id"), None)
+                if future is None:
+                    logger.debug("Dropping Mac backend response with no pending request")
+                elif not future.done():
+                    future.set_result((response, translated_audio))
+
+        except CONNECTION_CLOSED_ERRORS:
+            pass
+        except Exception as e:
+            logger.warning(f"Mac backend reader stopped: {e}")
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionResetError("Mac backend connection lost"))
+            pending.clear()
+            await self._discard(ws)
+
+    async def _discard(self, ws):
+        """Drop a connection that can no longer be reused."""
+        if self._ws is ws:
+            self._ws = None
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        """Close the connection if open."""
+        if self._ws is not None:
+            await self._discard(self._ws)
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
@@ -5,17 +5,68 @@ Handles audio buffering, VAD, and streaming translation.
 
 import asyncio
 import logging
-import json
-import base64
 import os
-from collections import deque
-from typing import Optional, Callable
-import websockets
+import struct
+from typing import Optional, Callable, Union
 import webrtcvad
-import wave
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from backend_connection import BackendConnection
+from speech_gate import create_speech_gate
+from workers import run_blocking
 
 logger = logging.getLogger(__name__)
 
+# Voice chat audio format: 16kHz mono 16-bit PCM in 20ms frames
+SAMPLE_RATE = 16000
+FRAME_BYTES = 640  # 20ms = 320 samples = 640 bytes
+RING_FRAMES = 1000  # ~20 seconds of frames buffered per utterance at most
+VAD_WINDOW_FRAMES = 5  # VAD decisions are made per 100ms window
+
+# Frames with RMS below this (about -50 dBFS) count as silence without
+# consulting webrtcvad
+SILENCE_RMS_FLOOR = 100
+
+# 44-byte RIFF/WAVE header for mono 16-bit PCM:
+# RIFF <size> WAVE, fmt chunk (PCM, channels, rate, byte rate, align, bits), data <size>
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+class BufferPool:
+    """
+    Recycles fixed-size bytearrays for per-utterance payloads.
+
+    Buffers are allocated on first demand and kept for reuse, up to
+    max_free idle buffers. Requests larger than the pool's buffer size get a
+    one-off bytearray that is not pooled.
+    """
+
+    def __init__(self, buffer_size: int, max_free: int = 4):
+        self.buffer_size = buffer_size
+        self.max_free = max_free
+        self._free: list[bytearray] = []
+
+    def acquire(self, size: int) -> bytearray:
+        """Get a buffer of at least size bytes."""
+        if size > self.buffer_size:
+            return bytearray(size)
+        return self._free.pop() if self._free else bytearray(self.buffer_size)
+
+    def release(self, buf: bytearray):
+        """Return a buffer obtained from acquire()."""
+        if len(buf) == self.buffer_size and len(self._free) < self.max_free:
+            self._free.append(buf)
+
+
+# WAV scratch buffers sized for a full audio ring (see RealtimeTranslationPipeline),
+# shared by all pipelines
+wav_buffer_pool = BufferPool(WAV_HEADER.size + FRAME_BYTES * RING_FRAMES)
+
 
 class RealtimeTranslationPipeline:
     """
@@ -35,6 +86,9 @@ class RealtimeTranslationPipeline:
         target_lang: str = "en",
         vad_aggressiveness: int = 2,
         silence_duration_ms: int = 500,
+        speech_gate_model: Optional[str] = None,
+        speech_gate_threshold: float = 0.5,
+        backend: Optional[BackendConnection] = None,
     ):
         """
         Initialize pipeline.
@@ -45,21 +99,44 @@ class RealtimeTranslationPipeline:
             target_lang: Target language code
             vad_aggressiveness: VAD sensitivity (0-3, higher = more aggressive)
             silence_duration_ms: Milliseconds of silence to detect speech end
+            speech_gate_model: Optional path to silero_vad.onnx; when set, audio
+                before detected speech is dropped instead of buffered
+            speech_gate_threshold: Silero speech probability threshold
+            backend: Optional shared backend connection; by default the
+                pipeline opens (and closes) its own
         """
         self.backend_url = mac_backend_url
+        self._owns_backend = backend is None
+        self.backend = backend or BackendConnection(mac_backend_url)
         self.source_lang = source_lang
         self.target_lang = target_lang
 
-        # Audio buffering
-        self.audio_buffer = deque(maxlen=1000)  # ~10 seconds at 100 chunks/sec
+        # Audio buffering: preallocated ring holding the most recent
+        # RING_FRAMES frames of PCM, so frames are copied in place instead of
+        # allocating a new bytes object per utterance
+        self._buf_capacity = FRAME_BYTES * RING_FRAMES
+        self._buf = bytearray(self._buf_capacity)
+        self._wpos = 0  # Next write offset into the ring
+        self._buffered = 0  # Bytes currently held (saturates at capacity)
+        self._written = 0  # Bytes written since the last reset
         self.is_processing = False
 
         # Voice Activity Detection
         self.vad = webrtcvad.Vad(vad_aggressiveness)
+        self._is_speech = self.vad.is_speech  # Bound once for the frame loop
         self.silence_frames = 0
         self.speech_frames = 0
         self.silence_threshold = silence_duration_ms // 10  # Convert to frame count
 
+        # Buffered audio is classified in VAD_WINDOW_FRAMES windows read
+        # straight out of the ring; each window gets one speech/silence decision
+        self._vad_pos = 0  # Bytes of buffered audio already classified
+
+        # Silero speech gate (first stage): drops leading non-speech before it
+        # is buffered; webrtcvad above stays the end-of-speech endpointer
+        self.speech_gate = create_speech_gate(speech_gate_model, speech_gate_threshold)
+        self._gate_open = False
+
         # Callback for translated audio
         self.on_translation_ready: Optional[Callable] = None
 
@@ -72,7 +149,7 @@ class RealtimeTranslationPipeline:
             f"VAD={vad_aggressiveness}, silence={silence_duration_ms}ms"
         )
 
-    async def process_incoming_audio(self, audio_chunk: bytes, sample_rate: int = 16000):
+    async def process_incoming_audio(self, audio_chunk: bytes, sample_rate: int = SAMPLE_RATE):
         """
         Process incoming audio chunk from voice chat.
 
@@ -80,60 +157,150 @@ class RealtimeTranslationPipeline:
             audio_chunk: Raw audio data (PCM)
             sample_rate: Audio sample rate in Hz
         """
+        # Skip audio until the speech gate hears speech, then keep everything
+        # so the endpointer can measure the trailing silence
+        if self.speech_gate is not None and not self._gate_open and sample_rate == SAMPLE_RATE:
+            if not self.speech_gate.is_speech(audio_chunk):
+                return
+            self._gate_open = True
+
         # Add to buffer
-        self.audio_buffer.append(audio_chunk)
+        self._buffer_audio(audio_chunk)
 
         # Check for speech end using VAD
         try:
-            # VAD expects 10, 20, or 30ms frames at 8000, 16000, or 32000 Hz
-            # For 16kHz, 20ms frame = 320 samples = 640 bytes (16-bit PCM)
-            if len(audio_chunk) == 640:  # 20ms frame at 16kHz
-                is_speech = self.vad.is_speech(audio_chunk, sample_rate)
-
-                if is_speech:
-                    self.speech_frames += 1
-                    self.silence_frames = 0
-                else:
-                    self.silence_frames += 1
-
-                # Speech ended if we have silence after speech
-                if (
-                    self.speech_frames > 10  # At least 200ms of speech
-                    and self.silence_frames >= self.silence_threshold
-                ):
-                    logger.info(
-                        f"Speech ended detected: {self.speech_frames} speech frames, "
-                        f"{self.silence_frames} silence frames"
-                    )
+            # webrtcvad takes 10, 20, or 30ms frames; windows are whole 20ms frames
+            frame_bytes = sample_rate // 50 * 2
+            window_bytes = frame_bytes * VAD_WINDOW_FRAMES
+
+            # Audio overwritten before it was classified can't be recovered
+            self._vad_pos = max(self._vad_pos, self._written - self._buf_capacity)
+
+            while self._written - self._vad_pos >= window_bytes:
+                window = self._ring_slice(self._vad_pos, window_bytes)
+                self._vad_pos += window_bytes
+
+                if self._process_vad_window(window, frame_bytes, sample_rate):
                     # Process buffered audio
                     await self.translate_speech()
-
-                    # Reset counters
-                    self.speech_frames = 0
-                    self.silence_frames = 0
+                    break
 
         except Exception as e:
             logger.error(f"VAD error: {e}")
 
+    def _ring_slice(self, offset: int, size: int) -> Union[bytes, memoryview]:
+        """
+        Get size bytes of buffered audio starting offset bytes after the last reset.
+
+        Args:
+            offset: Position in the stream written since the last reset
+            size: Number of bytes (at most the ring capacity)
+
+        Returns:
+            A view into the ring, or a copy if the span wraps around its end
+        """
+        start = offset % self._buf_capacity
+        end = start + size
+        view = memoryview(self._buf)
+        if end <= self._buf_capacity:
+            return view[start:end]
+        return view[start:].tobytes() + view[:end - self._buf_capacity]
+
+    def _process_vad_window(
+        self, window: Union[bytes, memoryview], frame_bytes: int, sample_rate: int
+    ) -> bool:
+        """
+        Classify one VAD window by majority vote and update speech/silence counters.
+
+        Counters stay in 20ms frame units, advanced a whole window at a time.
+
+        Args:
+            window: VAD_WINDOW_FRAMES frames of 16-bit PCM
+            frame_bytes: Size of one 20ms frame in bytes
+            sample_rate: Audio sample rate in Hz
+
+        Returns:
+            True if the end of an utterance was detected
+        """
+        is_speech = self._is_speech
+        view = memoryview(window)
+
+        voiced = 0
+        for i, quiet in enumerate(self._quiet_frames(window, VAD_WINDOW_FRAMES)):
+            if not quiet and is_speech(view[i * frame_bytes:(i + 1) * frame_bytes], sample_rate):
+                voiced += 1
+
+        if voiced * 2 > VAD_WINDOW_FRAMES:
+            self.speech_frames += VAD_WINDOW_FRAMES
+            self.silence_frames = 0
+        else:
+            self.silence_frames += VAD_WINDOW_FRAMES
+
+        # Speech ended if we have silence after speech
+        if (
+            self.speech_frames > 10  # At least 200ms of speech
+            and self.silence_frames >= self.silence_threshold
+        ):
+            logger.info(
+                f"Speech ended detected: {self.speech_frames} speech frames, "
+                f"{self.silence_frames} silence frames"
+            )
+            self.speech_frames = 0
+            self.silence_frames = 0
+            return True
+
+        # Gate opened on audio webrtcvad doesn't consider speech - close it
+        # again so the silence isn't buffered
+        if self.speech_frames == 0:
+            self._close_gate()
+
+        return False
+
+    def _quiet_frames(self, window: Union[bytes, memoryview], frame_count: int) -> list[bool]:
+        """
+        Flag near-silent frames with one vectorized RMS pass over a window.
+
+        Args:
+            window: 16-bit PCM made of frame_count equal-sized frames
+            frame_count: Number of frames in the window
+
+        Returns:
+            Per-frame flags, True where the frame is below SILENCE_RMS_FLOOR
+            (all False when numpy isn't installed)
+        """
+        if not NUMPY_AVAILABLE:
+            return [False] * frame_count
+
+        # int16 view straight over the ring - only the float copy allocates
+        samples = np.frombuffer(window, dtype=np.int16)
+        samples = samples.reshape(frame_count, -1).astype(np.float32)
+        rms = np.sqrt(np.mean(samples * samples, axis=1))
+        return (rms < SILENCE_RMS_FLOOR).tolist()
+
     async def translate_speech(self):
         """Process buffered audio through translation pipeline."""
         if self.is_processing:
             logger.debug("Already processing, skipping")
             return
 
-        if len(self.audio_buffer) == 0:
+        if self._buffered == 0:
             logger.debug("Empty buffer, skipping translation")
             return
 
         self.is_processing = True
+        wav_buffer = None
 
         try:
-            # Combine buffered audio
-            audio_data = b"".join(self.audio_buffer)
+            # Snapshot buffered audio
+            audio_data = self._read_buffer()
             logger.info(f"Processing {len(audio_data)} bytes of audio")
 
-            # Convert raw PCM to WAV format for Mac backend
-            wav_data = self._pcm_to_wav(audio_data)
+            # Convert raw PCM to WAV format for Mac backend, copying off the
+            # event loop so other pipelines keep processing audio
+            wav_buffer = wav_buffer_pool.acquire(WAV_HEADER.size + len(audio_data))
+            wav_data = await run_blocking(
+                self._pcm_to_wav, audio_data, SAMPLE_RATE, wav_buffer
+            )
 
             # Send to Mac backend
             translated_audio = await self._call_backend(wav_data)
@@ -149,8 +316,68 @@ class RealtimeTranslationPipeline:
             logger.error(f"Translation error: {e}", exc_info=True)
 
         finally:
+            if wav_buffer is not None:
+                wav_buffer_pool.release(wav_buffer)
             self.is_processing = False
-            self.audio_buffer.clear()
+            self._wpos = 0
+            self._buffered = 0
+            self._written = 0
+            self._vad_pos = 0
+            self._close_gate()
+
+    def _close_gate(self):
+        """Close the speech gate and clear its recurrent state for the next utterance."""
+        self._gate_open = False
+        if self.speech_gate is not None:
+            self.speech_gate.reset()
+
+    def _buffer_audio(self, audio_chunk: bytes):
+        """
+        Copy an audio chunk into the ring buffer, overwriting the oldest audio
+        once the buffer is full.
+
+        Args:
+            audio_chunk: Raw audio data (PCM)
+        """
+        capacity = self._buf_capacity
+        size = len(audio_chunk)
+
+        if size > capacity:
+            # Chunk alone overfills the ring - keep only its tail, as if the
+            # head had been written and overwritten
+            skip = size - capacity
+            audio_chunk = memoryview(audio_chunk)[skip:]
+            self._wpos = (self._wpos + skip) % capacity
+            self._written += skip
+            size = capacity
+
+        end = self._wpos + size
+        if end <= capacity:
+            self._buf[self._wpos:end] = audio_chunk
+        else:
+            # Wrap around the end of the ring
+            split = capacity - self._wpos
+            chunk_view = memoryview(audio_chunk)
+            self._buf[self._wpos:] = chunk_view[:split]
+            self._buf[:end - capacity] = chunk_view[split:]
+
+        self._wpos = end % capacity
+        self._buffered = min(self._buffered + size, capacity)
+        self._written += size
+
+    def _read_buffer(self) -> Union[bytes, memoryview]:
+        """
+        Get buffered audio in chronological order.
+
+        Returns:
+            Buffered PCM audio. Unless the ring has wrapped this is a view into
+            the buffer, only valid until the next write.
+        """
+        view = memoryview(self._buf)
+        if self._buffered < self._buf_capacity:
+            # Ring hasn't wrapped since the last reset, audio starts at 0
+            return view[:self._wpos]
+        return view[self._wpos:].tobytes() + view[:self._wpos]
 
     async def _call_backend(self, wav_data: bytes) -> Optional[bytes]:
         """
@@ -163,72 +390,67 @@ class RealtimeTranslationPipeline:
             Translated audio as bytes, or None if failed
         """
         try:
-            logger.info(f"Connecting to Mac backend at {self.backend_url}")
-
-            async with websockets.connect(
-                self.backend_url,
-                open_timeout=10,
-                close_timeout=10,
-                ping_timeout=60,
-                ping_interval=20,
-            ) as ws:
-                # Encode audio
-                audio_b64 = base64.b64encode(wav_data).decode("utf-8")
-
-                request = {
-                    "audio": audio_b64,
-                    "source_lang": self.source_lang,
-                    "target_lang": self.target_lang,
-                    "format": "wav",
-                }
-
-                # Send request
-                await ws.send(json.dumps(request))
-                logger.info("Sent translation request to backend")
-
-                # Receive response
-                response_str = await ws.recv()
-                response = json.loads(response_str)
-
-                if response.get("status") == "success":
-                    # Decode translated audio
-                    translated_audio = base64.b64decode(response["audio"])
-                    logger.info(
-                        f"✅ Translation successful: {response.get('transcription')} → "
-                        f"{response.get('translation')}"
-                    )
-                    return translated_audio
-                else:
-                    logger.error(f"Translation failed: {response.get('error')}")
-                    return None
+            request = {
+                "source_lang": self.source_lang,
+                "target_lang": self.target_lang,
+                "format": "wav",
+            }
+
+            response, translated_audio = await self.backend.translate(request, wav_data)
+            logger.info("Received translation response from backend")
+
+            if response.get("status") == "success":
+                logger.info(
+                    f"✅ Translation successful: {response.get('transcription')} → "
+                    f"{response.get('translation')}"
+                )
+                return translated_audio
+            else:
+                logger.error(f"Translation failed: {response.get('error')}")
+                return None
 
         except Exception as e:
             logger.error(f"Backend call error: {e}", exc_info=True)
             return None
 
-    def _pcm_to_wav(self, pcm_data: bytes, sample_rate: int = 16000) -> bytes:
+    def _pcm_to_wav(
+        self,
+        pcm_data: Union[bytes, memoryview],
+        sample_rate: int = SAMPLE_RATE,
+        out: Optional[bytearray] = None,
+    ) -> Union[bytes, memoryview]:
         """
         Convert raw PCM audio to WAV format.
 
         Args:
-            pcm_data: Raw PCM data (16-bit)
+            pcm_data: Raw PCM data (16-bit), any bytes-like object
             sample_rate: Sample rate in Hz
+            out: Optional scratch buffer of at least 44 + len(pcm_data) bytes
+                to assemble the WAV in instead of allocating a new one
 
         Returns:
-            WAV file as bytes
+            WAV file as bytes, or a view into out when given
         """
-        import io
+        data_size = len(pcm_data)
+        header = (
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, 1,  # PCM, mono
+            sample_rate, sample_rate * 2, 2, 16,  # byte rate, block align, 16-bit
+            b"data", data_size,
+        )
 
-        wav_buffer = io.BytesIO()
+        if out is None:
+            return WAV_HEADER.pack(*header) + pcm_data
 
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_data)
+        total_size = WAV_HEADER.size + data_size
+        WAV_HEADER.pack_into(out, 0, *header)
+        out[WAV_HEADER.size:total_size] = pcm_data
+        return memoryview(out)[:total_size]
 
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+    async def close(self):
+        """Close the backend connection, unless it is shared."""
+        if self._owns_backend:
+            await self.backend.close()
 
     def set_translation_callback(self, callback: Callable):
         """
@@ -0,0 +1,124 @@
+"""
+Silero VAD speech gate for voice chat audio.
+Drops non-speech frames before they are buffered or sent to the backend.
+"""
+
+import functools
+import logging
+from typing import Optional
+
+try:
+    import numpy as np
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_session(model_path: str):
+    """
+    Load the Silero ONNX model once per path.
+
+    The session is stateless (recurrent state is passed in on every run), so
+    all gates share it and only the first voice chat pays the model load.
+    """
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(
+        model_path, sess_options=options, providers=["CPUExecutionProvider"]
+    )
+
+
+class SileroSpeechGate:
+    """
+    Streaming speech detector backed by the Silero VAD ONNX model.
+
+    Incoming 16-bit PCM frames are accumulated into the 512-sample windows
+    Silero expects at 16kHz; each completed window updates the current
+    speech probability, which is held until the next window completes.
+    """
+
+    SAMPLE_RATE = 16000
+    WINDOW_SAMPLES = 512  # 32ms at 16kHz
+    CONTEXT_SAMPLES = 64  # Tail of the previous window prepended to each input
+
+    def __init__(self, model_path: str, threshold: float = 0.5):
+        """
+        Initialize speech gate.
+
+        Args:
+            model_path: Path to silero_vad.onnx
+            threshold: Speech probability at or above which a frame passes
+        """
+        if not ONNXRUNTIME_AVAILABLE:
+            raise ImportError(
+                "onnxruntime not available. Install with:\n"
+                "uv add --optional cloud onnxruntime numpy"
+            )
+
+        self.session = _load_session(model_path)
+        self.threshold = threshold
+
+        self._sr = np.array(self.SAMPLE_RATE, dtype=np.int64)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self.reset()
+
+        logger.info(f"Silero speech gate using {model_path}, threshold={threshold}")
+
+    def reset(self):
+        """Clear recurrent state between utterances."""
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, self.CONTEXT_SAMPLES), dtype=np.float32)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self.probability = 0.0
+
+    def is_speech(self, frame: bytes) -> bool:
+        """
+        Feed a PCM frame and report whether speech is currently present.
+
+        Args:
+            frame: Raw 16-bit mono PCM at 16kHz
+
+        Returns:
+            True if the latest speech probability meets the threshold
+        """
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
+        self._pending = np.concatenate((self._pending, samples))
+
+        while len(self._pending) >= self.WINDOW_SAMPLES:
+            window = self._pending[: self.WINDOW_SAMPLES].reshape(1, -1)
+            self._pending = self._pending[self.WINDOW_SAMPLES :]
+
+            model_input = np.concatenate((self._context, window), axis=1)
+            output, self._state = self.session.run(
+                None, {"input": model_input, "state": self._state, "sr": self._sr}
+            )
+            self._context = model_input[:, -self.CONTEXT_SAMPLES :]
+            self.probability = float(output[0][0])
+
+        return self.probability >= self.threshold
+
+
+def create_speech_gate(model_path: Optional[str], threshold: float = 0.5) -> Optional[SileroSpeechGate]:
+    """
+    Create a speech gate if a model is configured, logging instead of failing.
+
+    Args:
+        model_path: Path to silero_vad.onnx, or None/empty to disable
+        threshold: Speech probability threshold
+
+    Returns:
+        SileroSpeechGate instance, or None if disabled or unavailable
+    """
+    if not model_path:
+        return None
+
+    try:
+        return SileroSpeechGate(model_path, threshold)
+    except Exception as e:
+        logger.warning(f"Silero speech gate disabled: {e}")
+        return None
@@ -6,26 +6,31 @@ Supports both voice messages and real-time voice calls.
 
 import os
 import asyncio
-import json
-import base64
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from io import BytesIO
+from typing import Awaitable, Callable
+from urllib.parse import urlparse
 
 from telegram import Update
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     MessageHandler,
     ContextTypes,
     filters,
 )
-from pyrogram import Client
+from pyrogram import Client, filters as pyrogram_filters
+from pyrogram.handlers import MessageHandler as PyrogramMessageHandler
 import websockets
 from dotenv import load_dotenv
 
+from backend_connection import BackendConnection
 from voice_call_manager import VoiceCallManager
 from realtime_translation_pipeline import RealtimeTranslationPipeline
+from workers import run_blocking, shutdown as shutdown_workers
 
 # Load environment variables
 load_dotenv()
@@ -41,12 +46,46 @@ logger = logging.getLogger(__name__)
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 TELEGRAM_API_ID = os.getenv("TELEGRAM_API_ID")
 TELEGRAM_API_HASH = os.getenv("TELEGRAM_API_HASH")
+TELEGRAM_WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL")  # Unset = long polling
+TELEGRAM_WEBHOOK_PORT = int(os.getenv("TELEGRAM_WEBHOOK_PORT", "8443"))
+TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET")
 MAC_WEBSOCKET_URL = os.getenv("MAC_WEBSOCKET_URL", "ws://localhost:8000/ws/translate")
-ALLOWED_USER_IDS = (
-    os.getenv("ALLOWED_USER_IDS", "").split(",")
-    if os.getenv("ALLOWED_USER_IDS")
-    else []
-)
+_backend_url = urlparse(MAC_WEBSOCKET_URL)
+MAC_BACKEND_HOST = _backend_url.hostname
+MAC_BACKEND_PORT = _backend_url.port or (443 if _backend_url.scheme == "wss" else 80)
+
+
+def _parse_user_ids(raw: str) -> frozenset:
+    """
+    Parse a comma-separated list of Telegram user IDs.
+
+    Args:
+        raw: Value of ALLOWED_USER_IDS
+
+    Returns:
+        The numeric IDs; malformed entries are logged and skipped
+
+    Raises:
+        ValueError: If entries were given but none is numeric, since an empty
+            whitelist would let everyone in
+    """
+    entries = [uid.strip() for uid in raw.split(",") if uid.strip()]
+    user_ids = set()
+    for uid in entries:
+        try:
+            user_ids.add(int(uid))
+        except ValueError:
+            logger.warning(f"Ignoring non-numeric ALLOWED_USER_IDS entry: {uid!r}")
+
+    if entries and not user_ids:
+        raise ValueError(
+            f"ALLOWED_USER_IDS has no numeric user IDs: {raw!r}\n"
+            "Use comma-separated Telegram user IDs, e.g. 12345,67890"
+        )
+    return frozenset(user_ids)
+
+
+ALLOWED_USER_IDS = _parse_user_ids(os.getenv("ALLOWED_USER_IDS", ""))
 
 # Voice call settings
 VOICE_CALL_ENABLED = os.getenv("VOICE_CALL_ENABLED", "true").lower() == "true"
@@ -55,33 +94,36 @@ DEFAULT_SOURCE_LANG = os.getenv("DEFAULT_SOURCE_LANG", "es")
 DEFAULT_TARGET_LANG = os.getenv("DEFAULT_TARGET_LANG", "en")
 VAD_AGGRESSIVENESS = int(os.getenv("VAD_AGGRESSIVENESS", "2"))
 SILENCE_DURATION_MS = int(os.getenv("SILENCE_DURATION_MS", "500"))
-
-# User state management (simple in-memory for now)
-user_states = {}
-
-# Global instances (will be initialized in main)
-voice_manager: VoiceCallManager = None
-translation_pipelines = {}  # chat_id -> RealtimeTranslationPipeline
+SILERO_VAD_MODEL = os.getenv("SILERO_VAD_MODEL")
+SILERO_VAD_THRESHOLD = float(os.getenv("SILERO_VAD_THRESHOLD", "0.5"))
 
 
-async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle /start command."""
-    user = update.effective_user
-    logger.info(f"User {user.id} ({user.username}) started the bot")
-
-    voice_call_info = ""
-    if VOICE_CALL_ENABLED:
-        voice_call_info = """
+# Static command replies, built once since they only depend on configuration
+_VOICE_CALL_INFO = """
 **Voice Calls (NEW!):**
 /join - Join voice chat for real-time translation
 /leave - Leave voice chat
 
-"""
+""" if VOICE_CALL_ENABLED else ""
+
+_VOICE_CALL_HELP = """
+**Voice Calls:**
+/join - Join group voice chat for real-time translation
+/leave - Leave voice chat
+
+To use voice calls:
+1. Add me to a group chat
+2. Start a voice chat
+3. Send /join
+4. Speak and I'll translate live!
+
+""" if VOICE_CALL_ENABLED else ""
 
-    welcome_message = f"""
+# Formatted with first_name per /start
+WELCOME_MESSAGE_TEMPLATE = f"""
 🎙️ **Welcome to Levi Translation Service!** 🌍
 
-Hi {user.first_name}! I can help you translate between Spanish and English.
+Hi {{first_name}}! I can help you translate between Spanish and English.
 
 **How to use:**
 1. Send me a voice message in Spanish or English
@@ -89,7 +131,7 @@ Hi {user.first_name}! I can help you translate between Spanish and English.
 3. Translate it to the other language
 4. Send you back a voice message with the translation!
 
-{voice_call_info}**Commands:**
+{_VOICE_CALL_INFO}**Commands:**
 /start - Show this message
 /help - Get help
 /mode - Toggle translation mode (ES→EN or EN→ES)
@@ -100,30 +142,7 @@ Hi {user.first_name}! I can help you translate between Spanish and English.
 Try sending me a voice message! 🎤
     """
 
-    await update.message.reply_text(welcome_message, parse_mode="Markdown")
-
-    # Initialize user state
-    user_states[user.id] = {"source_lang": "es", "target_lang": "en"}
-
-
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle /help command."""
-    voice_call_help = ""
-    if VOICE_CALL_ENABLED:
-        voice_call_help = """
-**Voice Calls:**
-/join - Join group voice chat for real-time translation
-/leave - Leave voice chat
-
-To use voice calls:
-1. Add me to a group chat
-2. Start a voice chat
-3. Send /join
-4. Speak and I'll translate live!
-
-"""
-
-    help_text = f"""
+HELP_TEXT = f"""
 **Levi Translation Service Help** 📖
 
 **Available Commands:**
@@ -131,7 +150,7 @@ To use voice calls:
 /help - Show this help message
 /mode - Toggle between ES→EN and EN→ES
 /status - Check if the service is running
-{voice_call_help}
+{_VOICE_CALL_HELP}
 **How it works:**
 1. Record a voice message in Telegram
 2. Send it to me
@@ -148,7 +167,65 @@ To use voice calls:
 
 Need more help? Contact the developer!
     """
-    await update.message.reply_text(help_text, parse_mode="Markdown")
+
+# /mode replies, one per resulting direction
+_MODE_EN_ES_TEXT = "Translation mode changed to:\n**English → Spanish 🇨🇦 → 🇪🇸**"
+_MODE_ES_EN_TEXT = "Translation mode changed to:\n**Spanish → English 🇪🇸 → 🇨🇦**"
+
+
+@dataclass(slots=True)
+class UserState:
+    """Per-user translation direction."""
+
+    source_lang: str = "es"
+    target_lang: str = "en"
+
+
+class LRUDict(OrderedDict):
+    """Dict that evicts its least recently used entry beyond maxsize."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# User state management (simple in-memory for now); bounded so a long-running
+# bot doesn't keep every user it has ever seen - evicted users get defaults
+MAX_USER_STATES = 50_000
+user_states: LRUDict = LRUDict(MAX_USER_STATES)  # user_id -> UserState
+
+# Global instances (will be initialized in main)
+backend: BackendConnection = None  # Shared connection for voice messages
+voice_manager: VoiceCallManager = None
+translation_pipelines = {}  # chat_id -> RealtimeTranslationPipeline, removed on /leave
+
+
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /start command."""
+    user = update.effective_user
+    logger.info(f"User {user.id} ({user.username}) started the bot")
+
+    welcome_message = WELCOME_MESSAGE_TEMPLATE.format(first_name=user.first_name)
+    await update.message.reply_text(welcome_message, parse_mode="Markdown")
+
+    # Initialize user state
+    user_states[user.id] = UserState()
+
+
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /help command."""
+    await update.message.reply_text(HELP_TEXT, parse_mode="Markdown")
 
 
 async def toggle_mode(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -157,36 +234,87 @@ async def toggle_mode(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Get or initialize user state
     if user_id not in user_states:
-        user_states[user_id] = {"source_lang": "es", "target_lang": "en"}
+        user_states[user_id] = UserState()
 
     # Toggle mode
     current_state = user_states[user_id]
-    if current_state["source_lang"] == "es":
-        current_state["source_lang"] = "en"
-        current_state["target_lang"] = "es"
-        new_mode = "English → Spanish 🇨🇦 → 🇪🇸"
+    if current_state.source_lang == "es":
+        current_state.source_lang = "en"
+        current_state.target_lang = "es"
+        reply = _MODE_EN_ES_TEXT
     else:
-        current_state["source_lang"] = "es"
-        current_state["target_lang"] = "en"
-        new_mode = "Spanish → English 🇪🇸 → 🇨🇦"
+        current_state.source_lang = "es"
+        current_state.target_lang = "en"
+        reply = _MODE_ES_EN_TEXT
 
-    await update.message.reply_text(
-        f"Translation mode changed to:\n**{new_mode}**", parse_mode="Markdown"
-    )
+    await update.message.reply_text(reply, parse_mode="Markdown")
 
 
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /status command to check service health."""
     try:
-        # Try to connect to Mac backend
-        async with websockets.connect(MAC_WEBSOCKET_URL, open_timeout=5) as ws:
-            status_msg = "✅ **Service Status: Online**\n\nMac backend is reachable and ready for translations!"
+        # An open shared connection proves liveness; otherwise a bare TCP
+        # connect is enough, without a WebSocket handshake on the backend
+        if not backend.connected:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(MAC_BACKEND_HOST, MAC_BACKEND_PORT), timeout=2
+            )
+            writer.close()
+            await writer.wait_closed()
+        status_msg = "✅ **Service Status: Online**\n\nMac backend is reachable and ready for translations!"
     except Exception as e:
         status_msg = f"❌ **Service Status: Offline**\n\nCannot reach Mac backend.\nError: {str(e)}"
 
     await update.message.reply_text(status_msg, parse_mode="Markdown")
 
 
+async def join_voice_chat(chat_id: int, state: UserState, confirm: Callable[[], Awaitable]) -> bool:
+    """
+    Join a group voice chat and start translating it.
+
+    Args:
+        chat_id: Telegram chat ID of the group
+        state: Language settings for the chat's pipeline
+        confirm: Sends the join confirmation; called only if the join succeeds
+
+    Returns:
+        True if joined successfully, False otherwise
+    """
+    if not await voice_manager.join_voice_chat(chat_id):
+        return False
+
+    # Create translation pipeline for this chat off the event loop (the first
+    # VAD model load can take a while) while sending the confirmation. Model
+    # sessions and the backend connection are shared; only per-chat audio and
+    # VAD state is new. The two are independent: a failed reply mustn't leave
+    # us in the call without a pipeline.
+    pipeline, confirmed = await asyncio.gather(
+        run_blocking(
+            RealtimeTranslationPipeline,
+            mac_backend_url=MAC_WEBSOCKET_URL,
+            source_lang=state.source_lang,
+            target_lang=state.target_lang,
+            vad_aggressiveness=VAD_AGGRESSIVENESS,
+            silence_duration_ms=SILENCE_DURATION_MS,
+            speech_gate_model=SILERO_VAD_MODEL,
+            speech_gate_threshold=SILERO_VAD_THRESHOLD,
+            backend=backend,
+        ),
+        confirm(),
+        return_exceptions=True,
+    )
+
+    if isinstance(pipeline, BaseException):
+        # Don't stay in a call nothing is translating
+        await voice_manager.leave_voice_chat(chat_id)
+        raise pipeline
+
+    translation_pipelines[chat_id] = pipeline
+    if isinstance(confirmed, BaseException):
+        logger.warning(f"Failed to send join confirmation to {chat_id}: {confirmed}")
+    return True
+
+
 async def join_call(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /join command to join voice chat."""
     if not VOICE_CALL_ENABLED:
@@ -213,34 +341,26 @@ async def join_call(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Get user state for language settings
     if user_id not in user_states:
-        user_states[user_id] = {"source_lang": DEFAULT_SOURCE_LANG, "target_lang": DEFAULT_TARGET_LANG}
+        user_states[user_id] = UserState(DEFAULT_SOURCE_LANG, DEFAULT_TARGET_LANG)
 
     state = user_states[user_id]
 
     try:
         # Join the voice chat
-        success = await voice_manager.join_voice_chat(chat_id)
-
-        if success:
-            # Create translation pipeline for this chat
-            pipeline = RealtimeTranslationPipeline(
-                mac_backend_url=MAC_WEBSOCKET_URL,
-                source_lang=state["source_lang"],
-                target_lang=state["target_lang"],
-                vad_aggressiveness=VAD_AGGRESSIVENESS,
-                silence_duration_ms=SILENCE_DURATION_MS,
-            )
-
-            translation_pipelines[chat_id] = pipeline
-
-            await update.message.reply_text(
+        success = await join_voice_chat(
+            chat_id,
+            state,
+            lambda: update.message.reply_text(
                 f"✅ **Joined voice chat!**\n\n"
-                f"🎙️ Translation mode: {state['source_lang'].upper()} → {state['target_lang'].upper()}\n\n"
+                f"🎙️ Translation mode: {state.source_lang.upper()} → {state.target_lang.upper()}\n\n"
                 f"Speak and I'll translate in real-time!\n"
                 f"Use /mode to change language direction.\n"
                 f"Use /leave to exit the voice chat.",
                 parse_mode="Markdown",
-            )
+            ),
+        )
+
+        if success:
             logger.info(f"Successfully joined voice chat {chat_id}")
         else:
             await update.message.reply_text(
@@ -277,8 +397,9 @@ async def leave_call(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         if success:
             # Clean up translation pipeline
-            if chat_id in translation_pipelines:
-                del translation_pipelines[chat_id]
+            pipeline = translation_pipelines.pop(chat_id, None)
+            if pipeline:
+                await pipeline.close()
 
             await update.message.reply_text(
                 "👋 **Left voice chat**\n\n"
@@ -298,13 +419,28 @@ async def leave_call(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
 
 
+async def _download_voice(bot, file_id: str) -> bytearray:
+    """
+    Download a voice message from Telegram.
+
+    Args:
+        bot: Telegram bot instance
+        file_id: File ID of the voice message
+
+    Returns:
+        Raw OGG bytes, downloaded straight into a bytearray (sent as-is, no copy)
+    """
+    file = await bot.get_file(file_id)
+    return await file.download_as_bytearray()
+
+
 async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle voice messages."""
     user = update.effective_user
     user_id = user.id
 
     # Check if user is allowed (if whitelist is configured)
-    if ALLOWED_USER_IDS and str(user_id) not in ALLOWED_USER_IDS:
+    if ALLOWED_USER_IDS and user_id not in ALLOWED_USER_IDS:
         logger.warning(f"Unauthorized access attempt by user {user_id}")
         await update.message.reply_text(
             "Sorry, you are not authorized to use this bot."
@@ -313,11 +449,11 @@ async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # Get user state
     if user_id not in user_states:
-        user_states[user_id] = {"source_lang": "es", "target_lang": "en"}
+        user_states[user_id] = UserState()
 
     state = user_states[user_id]
-    source_lang = state["source_lang"]
-    target_lang = state["target_lang"]
+    source_lang = state.source_lang
+    target_lang = state.target_lang
 
     logger.info(
         f"Received voice message from {user.username} ({user_id}), mode: {source_lang}→{target_lang}"
@@ -330,55 +466,26 @@ async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
     )
 
     try:
-        # Download voice message
-        voice = update.message.voice
-        file = await context.bot.get_file(voice.file_id)
-
-        # Download to BytesIO
-        voice_data = BytesIO()
-        await file.download_to_memory(voice_data)
-        voice_data.seek(0)
-
-        # Encode as base64
-        audio_b64 = base64.b64encode(voice_data.read()).decode("utf-8")
-
-        # Send to Mac backend via WebSocket
-        logger.info(f"Connecting to Mac backend at {MAC_WEBSOCKET_URL}")
-
-        async with websockets.connect(
-            MAC_WEBSOCKET_URL,
-            open_timeout=10,
-            close_timeout=10,
-            ping_timeout=60,  # Keep connection alive for up to 60 seconds
-            ping_interval=20,  # Send ping every 20 seconds
-        ) as ws:
-            # Send translation request
-            request = {
-                "audio": audio_b64,
-                "source_lang": source_lang,
-                "target_lang": target_lang,
-                "format": "ogg",  # Telegram voice messages are OGG
-            }
-
-            await ws.send(json.dumps(request))
-
-            # Update status
-            await processing_msg.edit_text(
-                f"🎙️ Voice received!\n"
-                f"⏳ Translating {source_lang.upper()} → {target_lang.upper()}..."
-            )
+        # Download voice message while (re)connecting to the backend, so a
+        # cold connection doesn't add its handshake after the download
+        audio_bytes, _ = await asyncio.gather(
+            _download_voice(context.bot, update.message.voice.file_id),
+            backend.connect(),
+        )
 
-            # Receive response
-            response_str = await ws.recv()
-            response = json.loads(response_str)
+        # Send to Mac backend over the shared WebSocket; the processing
+        # message already tells the user we're working on it
+        request = {
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "format": "ogg",  # Telegram voice messages are OGG
+        }
+        response, translated_audio = await backend.translate(request, audio_bytes)
 
         if response["status"] == "success":
-            # Decode translated audio
-            translated_audio = base64.b64decode(response["audio"])
-
             # Send as voice message
             await update.message.reply_voice(
-                voice=BytesIO(translated_audio),
+                voice=translated_audio,
                 caption=f"✅ Translation ({source_lang.upper()}→{target_lang.upper()}):\n\n"
                 f"**Original:** {response['transcription']}\n\n"
                 f"**Translation:** {response['translation']}\n\n"
@@ -398,7 +505,7 @@ async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
             await processing_msg.edit_text(f"❌ Translation failed:\n{error_msg}")
             logger.error(f"Translation failed for user {user_id}: {error_msg}")
 
-    except websockets.exceptions.WebSocketException as e:
+    except (websockets.exceptions.WebSocketException, OSError) as e:
         await processing_msg.edit_text(
             "❌ Cannot connect to translation service.\n"
             "Please try again later or contact support."
@@ -410,9 +517,39 @@ async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
         logger.error(f"Error processing voice message: {e}", exc_info=True)
 
 
+async def auto_join_voice_chat(client, message):
+    """Auto-join when voice chat starts in a group (video_chat_started service messages only)."""
+    try:
+        chat_id = message.chat.id
+        logger.info(f"🎙️ Voice chat started in {chat_id}, auto-joining...")
+
+        # Auto-join the voice chat with default language settings
+        default_state = UserState(DEFAULT_SOURCE_LANG, DEFAULT_TARGET_LANG)
+        success = await join_voice_chat(
+            chat_id,
+            default_state,
+            lambda: client.send_message(
+                chat_id,
+                f"🎙️ **Auto-joined voice chat!**\n\n"
+                f"Translation mode: {default_state.source_lang.upper()} → {default_state.target_lang.upper()}\n\n"
+                f"Speak and I'll translate!\n"
+                f"Use /mode to change languages.\n"
+                f"Use /leave to exit."
+            ),
+        )
+
+        if success:
+            logger.info(f"✅ Auto-joined voice chat in {chat_id}")
+        else:
+            logger.warning(f"Failed to auto-join voice chat in {chat_id}")
+
+    except Exception as e:
+        logger.error(f"Error in auto-join handler: {e}", exc_info=True)
+
+
 async def async_main():
     """Async main function to run both clients concurrently."""
-    global voice_manager
+    global backend, voice_manager
 
     # Validate configuration
     if not TELEGRAM_BOT_TOKEN:
@@ -428,11 +565,30 @@ async def async_main():
     logger.info(f"Starting Levi Telegram Bot...")
     logger.info(f"Mac backend URL: {MAC_WEBSOCKET_URL}")
     if ALLOWED_USER_IDS:
-        logger.info(f"User whitelist enabled: {ALLOWED_USER_IDS}")
+        logger.info(f"User whitelist enabled: {sorted(ALLOWED_USER_IDS)}")
     logger.info(f"Voice calls enabled: {VOICE_CALL_ENABLED}")
 
-    # Create python-telegram-bot application
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Backend connection is shared by all requests and kept open (see below)
+    backend = BackendConnection(MAC_WEBSOCKET_URL)
+
+    # Create python-telegram-bot application with a shared HTTP pool sized so
+    # replies/edits/downloads from concurrent updates don't queue on it
+    builder = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .connection_pool_size(64)
+        .pool_timeout(10)
+        .read_timeout(30)
+        .write_timeout(30)
+        .get_updates_connection_pool_size(8)
+        .concurrent_updates(True)
+    )
+    try:
+        # Smooths bursts under Telegram's flood limits (needs aiolimiter)
+        builder = builder.rate_limiter(AIORateLimiter())
+    except RuntimeError:
+        logger.info("AIORateLimiter unavailable, install python-telegram-bot[rate-limiter]")
+    application = builder.build()
 
     # Add handlers
     application.add_handler(CommandHandler("start", start))
@@ -457,10 +613,29 @@ async def async_main():
     # Start python-telegram-bot
     await application.initialize()
     await application.start()
-    await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+
+    # Only messages reach our handlers, so don't have Telegram send anything else
+    allowed_updates = [Update.MESSAGE]
+    if TELEGRAM_WEBHOOK_URL:
+        # Push delivery: no empty polling round-trips (needs python-telegram-bot[webhooks])
+        await application.updater.start_webhook(
+            listen="0.0.0.0",
+            port=TELEGRAM_WEBHOOK_PORT,
+            url_path=urlparse(TELEGRAM_WEBHOOK_URL).path.lstrip("/"),
+            webhook_url=TELEGRAM_WEBHOOK_URL,
+            secret_token=TELEGRAM_WEBHOOK_SECRET,
+            allowed_updates=allowed_updates,
+        )
+        logger.info(f"Receiving updates via webhook at {TELEGRAM_WEBHOOK_URL}")
+    else:
+        await application.updater.start_polling(allowed_updates=allowed_updates)
 
     logger.info("✅ Python-telegram-bot started")
 
+    # Dial the backend now and redial whenever it drops, so voice messages
+    # don't pay the connection handshake
+    backend_supervisor = asyncio.create_task(backend.keep_connected())
+
     # Initialize Pyrogram client and voice manager if voice calls are enabled
     pyrogram_client = None
     if VOICE_CALL_ENABLED and TELEGRAM_API_ID and TELEGRAM_API_HASH:
@@ -483,49 +658,11 @@ async def async_main():
 
             # Register auto-join handler for voice chats if enabled
             if AUTO_JOIN_VOICE_CHATS:
-                @pyrogram_client.on_message()
-                async def auto_join_voice_chat(client, message):
-                    """Auto-join when voice chat starts in a group."""
-                    try:
-                        # Check if this is a voice chat started service message
-                        if message.service and hasattr(message, 'video_chat_started'):
-                            chat_id = message.chat.id
-                            logger.info(f"🎙️ Voice chat started in {chat_id}, auto-joining...")
-
-                            # Auto-join the voice chat
-                            success = await voice_manager.join_voice_chat(chat_id)
-
-                            if success:
-                                # Get default language settings
-                                default_state = {"source_lang": DEFAULT_SOURCE_LANG, "target_lang": DEFAULT_TARGET_LANG}
-
-                                # Create translation pipeline for this chat
-                                pipeline = RealtimeTranslationPipeline(
-                                    mac_backend_url=MAC_WEBSOCKET_URL,
-                                    source_lang=default_state["source_lang"],
-                                    target_lang=default_state["target_lang"],
-                                    vad_aggressiveness=VAD_AGGRESSIVENESS,
-                                    silence_duration_ms=SILENCE_DURATION_MS,
-                                )
-                                translation_pipelines[chat_id] = pipeline
-
-                                logger.info(f"✅ Auto-joined voice chat in {chat_id}")
-
-                                # Send confirmation message to the group
-                                await client.send_message(
-                                    chat_id,
-                                    f"🎙️ **Auto-joined voice chat!**\n\n"
-                                    f"Translation mode: {default_state['source_lang'].upper()} → {default_state['target_lang'].upper()}\n\n"
-                                    f"Speak and I'll translate!\n"
-                                    f"Use /mode to change languages.\n"
-                                    f"Use /leave to exit."
-                                )
-                            else:
-                                logger.warning(f"Failed to auto-join voice chat in {chat_id}")
-
-                    except Exception as e:
-                        logger.error(f"Error in auto-join handler: {e}", exc_info=True)
-
+                pyrogram_client.add_handler(
+                    PyrogramMessageHandler(
+                        auto_join_voice_chat, pyrogram_filters.video_chat_started
+                    )
+                )
                 logger.info("✅ Pyrogram client and voice manager started")
                 logger.info("✅ Auto-join enabled for voice chats")
             else:
@@ -547,6 +684,11 @@ async def async_main():
     # Cleanup
     if voice_manager:
         await voice_manager.stop()
+    for pipeline in translation_pipelines.values():
+        await pipeline.close()
+    backend_supervisor.cancel()
+    await backend.close()
+    shutdown_workers()
     if pyrogram_client:
         await pyrogram_client.stop()
 
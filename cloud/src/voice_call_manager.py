@@ -5,7 +5,9 @@ Handles joining/leaving voice chats using Telegram's MTProto.
 
 import logging
 import asyncio
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
 from pyrogram import raw
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,8 @@ logger = logging.getLogger(__name__)
 class VoiceCallManager:
     """Manages Telegram voice chat connections using raw MTProto."""
 
+    PEER_CACHE_SIZE = 256
+
     def __init__(self, pyrogram_client):
         """
         Initialize voice call manager.
@@ -23,6 +27,8 @@ class VoiceCallManager:
         """
         self.client = pyrogram_client
         self.active_calls: Dict[int, dict] = {}  # chat_id -> call_state
+        self._peer_cache: "OrderedDict[int, Any]" = OrderedDict()  # chat_id -> input peer (LRU)
+        self._leaving: Set[int] = set()  # chat_ids with a LeaveGroupCall in flight
         self._started = False
         logger.info("VoiceCallManager initialized (Raw MTProto)")
 
@@ -40,16 +46,60 @@ class VoiceCallManager:
         if not self._started:
             return
 
-        # Leave all active calls first
-        for chat_id in list(self.active_calls.keys()):
-            try:
-                await self.leave_voice_chat(chat_id)
-            except Exception as e:
-                logger.error(f"Error leaving chat {chat_id}: {e}")
+        # Leave all active calls first, concurrently
+        chat_ids = list(self.active_calls.keys())
+        results = await asyncio.gather(
+            *(self.leave_voice_chat(chat_id) for chat_id in chat_ids),
+            return_exceptions=True,
+        )
+        for chat_id, result in zip(chat_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error leaving chat {chat_id}: {result}")
 
         self._started = False
         logger.info("VoiceCallManager stopped")
 
+    async def _resolve_peer(self, chat_id: int):
+        """
+        Resolve a chat ID to an input peer, memoizing recent lookups.
+
+        Args:
+            chat_id: Telegram chat ID
+
+        Returns:
+            Raw input peer for the chat
+        """
+        peer = self._peer_cache.get(chat_id)
+        if peer is not None:
+            self._peer_cache.move_to_end(chat_id)
+            return peer
+
+        peer = await self.client.resolve_peer(chat_id)
+        self._peer_cache[chat_id] = peer
+        if len(self._peer_cache) > self.PEER_CACHE_SIZE:
+            self._peer_cache.popitem(last=False)
+        return peer
+
+    async def _fetch_call(self, peer):
+        """
+        Get a group's current voice chat from its full chat info.
+
+        Args:
+            peer: InputPeerChannel or InputPeerChat of the group
+
+        Returns:
+            Input call reference, or None if no voice chat is running
+        """
+        if isinstance(peer, raw.types.InputPeerChannel):
+            full_chat = await self.client.invoke(
+                raw.functions.channels.GetFullChannel(channel=peer)
+            )
+        else:
+            full_chat = await self.client.invoke(
+                raw.functions.messages.GetFullChat(chat_id=peer.chat_id)
+            )
+        return full_chat.full_chat.call
+
     async def join_voice_chat(self, chat_id: int, audio_path: Optional[str] = None) -> bool:
         """
         Join a voice chat in a group using raw Telegram API.
@@ -73,23 +123,14 @@ class VoiceCallManager:
             logger.info(f"Attempting to join voice chat in {chat_id}")
 
             # Get the chat's full info to find the active call
-            peer = await self.client.resolve_peer(chat_id)
+            peer = await self._resolve_peer(chat_id)
 
-            # Get full chat info
-            if isinstance(peer, raw.types.InputPeerChannel):
-                full_chat = await self.client.invoke(
-                    raw.functions.channels.GetFullChannel(channel=peer)
-                )
-                call = full_chat.full_chat.call
-            elif isinstance(peer, raw.types.InputPeerChat):
-                full_chat = await self.client.invoke(
-                    raw.functions.messages.GetFullChat(chat_id=peer.chat_id)
-                )
-                call = full_chat.full_chat.call
-            else:
+            if not isinstance(peer, (raw.types.InputPeerChannel, raw.types.InputPeerChat)):
                 logger.error(f"Invalid peer type for chat {chat_id}")
                 return False
 
+            call = await self._fetch_call(peer)
+
             if not call:
                 logger.error(f"No active voice chat in {chat_id}")
                 return False
@@ -109,9 +150,11 @@ class VoiceCallManager:
 
             logger.info(f"Join result: {result}")
 
-            # Track the call
+            # Track the call, keeping the references needed to leave it
             self.active_calls[chat_id] = {
-                "joined_at": asyncio.get_event_loop().time(),
+                "joined_at": time.monotonic(),
+                "peer": peer,
+                "call": call,
                 "call_id": call.id,
                 "stream_active": False,
             }
@@ -133,45 +176,39 @@ class VoiceCallManager:
         Returns:
             True if left successfully, False otherwise
         """
-        if chat_id not in self.active_calls:
+        call_info = self.active_calls.get(chat_id)
+        if call_info is None:
             logger.warning(f"Not in voice chat {chat_id}, cannot leave")
             return False
+        if chat_id in self._leaving:
+            # Another leave is in flight; don't invoke LeaveGroupCall twice
+            logger.warning(f"Already leaving voice chat {chat_id}")
+            return False
 
+        self._leaving.add(chat_id)
         try:
             logger.info(f"Leaving voice chat in {chat_id}")
 
-            call_info = self.active_calls[chat_id]
-
-            # Get the chat peer
-            peer = await self.client.resolve_peer(chat_id)
-
-            # Get call reference
-            if isinstance(peer, raw.types.InputPeerChannel):
-                full_chat = await self.client.invoke(
-                    raw.functions.channels.GetFullChannel(channel=peer)
-                )
-                call = full_chat.full_chat.call
-            elif isinstance(peer, raw.types.InputPeerChat):
-                full_chat = await self.client.invoke(
-                    raw.functions.messages.GetFullChat(chat_id=peer.chat_id)
-                )
-                call = full_chat.full_chat.call
-            else:
-                logger.error(f"Invalid peer type for chat {chat_id}")
-                return False
+            # Reuse the call reference from join, no need to refetch chat info
+            call = call_info["call"]
 
-            if call:
-                # Leave the call
+            try:
                 await self.client.invoke(
                     raw.functions.phone.LeaveGroupCall(
                         call=call,
                         source=0,
                     )
                 )
-
-            # Remove from tracking
-            del self.active_calls[chat_id]
-
+            except Exception:
+                # The voice chat may have ended since we joined; if it's no
+                # longer the group's current call there is nothing to leave
+                current = await self._fetch_call(call_info["peer"])
+                if current is not None and current.id == call_info["call_id"]:
+                    raise
+                logger.info(f"Voice chat {chat_id} already ended")
+
+            # Only stop tracking once the leave has gone through
+            self.active_calls.pop(chat_id, None)
             logger.info(f"✅ Successfully left voice chat {chat_id}")
             return True
 
@@ -179,6 +216,9 @@ class VoiceCallManager:
             logger.error(f"Failed to leave voice chat {chat_id}: {e}", exc_info=True)
             return False
 
+        finally:
+            self._leaving.discard(chat_id)
+
     async def change_stream(self, chat_id: int, audio_path: str) -> bool:
         """
         Change the audio stream being played in a voice chat.
@@ -203,6 +243,6 @@ class VoiceCallManager:
         """Check if bot is currently in a voice chat."""
         return chat_id in self.active_calls
 
-    def get_active_calls(self) -> list:
-        """Get list of active call chat IDs."""
-        return list(self.active_calls.keys())
+    def get_active_calls(self) -> tuple:
+        """Get a snapshot of active call chat IDs."""
+        return tuple(self.active_calls)
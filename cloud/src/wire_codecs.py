@@ -0,0 +1,19 @@
+"""
+Codecs for messages on the Mac backend WebSocket wire, using a faster
+drop-in library when it is installed.
+"""
+import json
+
+try:
+    # C JSON codec for request/response headers; orjson emits bytes, but
+    # headers must go out as text frames
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
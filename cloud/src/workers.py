@@ -0,0 +1,35 @@
+"""
+Dedicated thread pool for blocking audio work (WAV building and
+VAD model loading), kept apart from the default executor that
+python-telegram-bot and Pyrogram use for their own blocking calls.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+CPU_WORKERS = 4
+
+# Threads are started lazily, on first submitted job
+cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="levi-cpu")
+
+
+async def run_blocking(func, /, *args, **kwargs):
+    """
+    Run a blocking function on the audio worker pool.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(cpu_executor, functools.partial(func, *args, **kwargs))
+
+
+def shutdown():
+    """Stop the worker pool, dropping jobs that haven't started."""
+    cpu_executor.shutdown(wait=False, cancel_futures=True)
@@ -1,13 +1,10 @@
 """Configuration management commands."""
 
 import click
-from rich.console import Console
 
 from levi_cli.core.config_manager import CloudConfig, MacConfig
 from levi_cli.core.project import get_project_paths
-from levi_cli.utils.output import print_error, print_json, print_key_value, print_success, print_warning
-
-console = Console()
+from levi_cli.utils.output import get_console, print_error, print_json, print_key_value, print_success, print_warning
 
 
 @click.group()
@@ -58,19 +55,23 @@ def show(ctx, service, no_redact, output_json):
         # Load Mac config if requested or if showing all
         if service is None or service == "mac":
             mac_config = MacConfig.from_env(paths.mac_env)
-            config_data["mac"] = mac_config.to_dict(redact=redact)
+            config_data["mac"] = (
+                mac_config.to_dict_raw(redact=redact) if output_json else mac_config.to_dict(redact=redact)
+            )
 
         # Load Cloud config if requested or if showing all
         if service is None or service == "cloud":
             cloud_config = CloudConfig.from_env(paths.cloud_env)
-            config_data["cloud"] = cloud_config.to_dict(redact=redact)
+            config_data["cloud"] = (
+                cloud_config.to_dict_raw(redact=redact) if output_json else cloud_config.to_dict(redact=redact)
+            )
 
         if output_json:
             print_json(config_data)
         else:
             # Pretty print
             for service_name, config in config_data.items():
-                console.print(f"\n[bold cyan]{service_name.upper()} Configuration:[/bold cyan]")
+                get_console().print(f"\n[bold cyan]{service_name.upper()} Configuration:[/bold cyan]")
                 for key, value in config.items():
                     print_key_value(key, value)
 
@@ -80,7 +81,7 @@ def show(ctx, service, no_redact, output_json):
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         if ctx.obj.get("verbose"):
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
 
 
@@ -109,7 +110,7 @@ def validate(ctx, service):
 
         # Validate Mac config if requested or if validating all
         if service is None or service == "mac":
-            console.print("\n[bold]Mac Backend Configuration:[/bold]")
+            get_console().print("\n[bold]Mac Backend Configuration:[/bold]")
 
             if not paths.mac_env.exists():
                 print_error(f"Configuration file not found: {paths.mac_env}")
@@ -128,7 +129,7 @@ def validate(ctx, service):
 
         # Validate Cloud config if requested or if validating all
         if service is None or service == "cloud":
-            console.print("\n[bold]Cloud Bot Configuration:[/bold]")
+            get_console().print("\n[bold]Cloud Bot Configuration:[/bold]")
 
             if not paths.cloud_env.exists():
                 print_error(f"Configuration file not found: {paths.cloud_env}")
@@ -146,10 +147,10 @@ def validate(ctx, service):
                     print_success("Cloud configuration is valid")
 
         if not all_valid:
-            console.print(f"\n[red]Found {len(errors_found)} validation error(s)[/red]")
+            get_console().print(f"\n[red]Found {len(errors_found)} validation error(s)[/red]")
             ctx.exit(1)
         else:
-            console.print("\n[green]All configuration is valid[/green]")
+            get_console().print("\n[green]All configuration is valid[/green]")
 
     except RuntimeError as e:
         print_error(str(e))
@@ -157,5 +158,5 @@ def validate(ctx, service):
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         if ctx.obj.get("verbose"):
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
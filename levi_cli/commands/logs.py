@@ -3,13 +3,10 @@
 import sys
 
 import click
-from rich.console import Console
 
 from levi_cli.core.log_manager import LogManager
 from levi_cli.core.project import get_project_paths
-from levi_cli.utils.output import print_error, print_info
-
-console = Console()
+from levi_cli.utils.output import get_console, print_error, print_info
 
 
 @click.group()
@@ -41,8 +38,13 @@ def logs():
     default=50,
     help="Number of lines to show (default: 50)",
 )
+@click.option(
+    "--no-color",
+    is_flag=True,
+    help="Print lines as-is, without level colors (default when not a terminal)",
+)
 @click.pass_context
-def tail(ctx, service, lines):
+def tail(ctx, service, lines, no_color):
     """
     Show recent log entries.
 
@@ -52,6 +54,7 @@ def tail(ctx, service, lines):
         levi logs tail                      # Show 50 lines from all services
         levi logs tail -n 100               # Show 100 lines
         levi logs tail --service mac-backend  # Show Mac backend logs only
+        levi logs tail -n 10000 --no-color > backend.log  # Dump raw log lines
     """
     try:
         paths = get_project_paths()
@@ -67,6 +70,9 @@ def tail(ctx, service, lines):
         else:
             services = ["mac-backend", "telegram-bot"]
 
+        # Colors only help on a terminal; otherwise copy the raw bytes
+        colorize = not no_color and sys.stdout.isatty()
+
         for svc in services:
             log_path = manager.get_log_path(svc)
 
@@ -75,7 +81,12 @@ def tail(ctx, service, lines):
                 continue
 
             # Print header
-            console.print(f"\n[bold cyan]=== {svc.upper()} (last {lines} lines) ===[/bold cyan]\n")
+            get_console().print(f"\n[bold cyan]=== {svc.upper()} (last {lines} lines) ===[/bold cyan]\n")
+
+            if not colorize:
+                sys.stdout.flush()
+                manager.copy_tail(svc, lines, sys.stdout.buffer)
+                continue
 
             # Get and print log lines
             log_lines = manager.tail(svc, lines)
@@ -91,7 +102,7 @@ def tail(ctx, service, lines):
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         if ctx.obj.get("verbose"):
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
 
 
@@ -133,13 +144,14 @@ def follow(ctx, service):
         if not log_path.exists():
             print_info(f"Waiting for log file: {log_path}")
 
-        # Follow the log file
+        # Follow the log file, writing each batch of new lines in one go
         try:
-            for line in manager.follow(service, colorize=True):
-                print(line, end="")
-                sys.stdout.flush()
+            out = sys.stdout.buffer
+            for chunk in manager.follow_batches(service, colorize=True):
+                out.write(chunk)
+                out.flush()
         except KeyboardInterrupt:
-            console.print("\n[yellow]Stopped following logs[/yellow]")
+            get_console().print("\n[yellow]Stopped following logs[/yellow]")
             ctx.exit(0)
 
     except RuntimeError as e:
@@ -148,5 +160,5 @@ def follow(ctx, service):
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         if ctx.obj.get("verbose"):
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
@@ -1,19 +1,54 @@
 """Service management commands."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 import click
-from rich.console import Console
 
 from levi_cli.core.project import get_project_paths
 from levi_cli.core.service_manager import LaunchAgentManager, ServiceName
 from levi_cli.utils.output import (
     print_error,
     print_json,
+    print_rows,
     print_success,
-    print_table,
     print_warning,
 )
 
-console = Console()
+
+def _run_for_services(
+    manager: LaunchAgentManager,
+    action: Callable[..., tuple[bool, str]],
+    services: list[ServiceName],
+) -> list[str]:
+    """
+    Run a service action for several services concurrently.
+
+    The actions mostly wait on launchctl subprocesses, so threads overlap them.
+    One launchctl listing, fetched up front, serves every action's status
+    check. Results are printed in the order the services were given.
+
+    Args:
+        manager: Manager the action belongs to
+        action: Manager method taking a service, returning (success, message)
+        services: Services to run it for
+
+    Returns:
+        List of error messages (empty if all succeeded)
+    """
+    manager.refresh_list_cache()
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        results = list(executor.map(lambda service: action(service, refresh=False), services))
+
+    errors = []
+    for success, message in results:
+        if success:
+            print_success(message)
+        else:
+            print_error(message)
+            errors.append(message)
+
+    return errors
 
 
 @click.group()
@@ -66,14 +101,7 @@ def start(ctx, service):
             services_to_start = list(ServiceName)
 
         # Start services
-        errors = []
-        for svc in services_to_start:
-            success, message = manager.start(svc)
-            if success:
-                print_success(message)
-            else:
-                print_error(message)
-                errors.append(message)
+        errors = _run_for_services(manager, manager.start, services_to_start)
 
         if errors:
             ctx.exit(1)
@@ -116,14 +144,7 @@ def stop(ctx, service):
             services_to_stop = list(ServiceName)
 
         # Stop services
-        errors = []
-        for svc in services_to_stop:
-            success, message = manager.stop(svc)
-            if success:
-                print_success(message)
-            else:
-                print_error(message)
-                errors.append(message)
+        errors = _run_for_services(manager, manager.stop, services_to_stop)
 
         if errors:
             ctx.exit(1)
@@ -167,14 +188,7 @@ def restart(ctx, service):
             services_to_restart = list(ServiceName)
 
         # Restart services
-        errors = []
-        for svc in services_to_restart:
-            success, message = manager.restart(svc)
-            if success:
-                print_success(message)
-            else:
-                print_error(message)
-                errors.append(message)
+        errors = _run_for_services(manager, manager.restart, services_to_restart)
 
         if errors:
             ctx.exit(1)
@@ -201,35 +215,34 @@ def status(ctx, output_json):
         paths = get_project_paths()
         manager = LaunchAgentManager(paths.root)
 
-        # Get status for all services
-        services = []
-        for service_name in ServiceName:
-            status = manager.get_status(service_name)
-            services.append(
-                {
-                    "Service": service_name.display_name,
-                    "Status": (status.status_str, status.status_color),
-                    "PID": str(status.pid) if status.pid else "-",
-                    "Last Exit": str(status.last_exit) if status.last_exit is not None else "-",
-                }
-            )
+        statuses = manager.get_all_statuses()
 
         if output_json:
-            # Convert to JSON-friendly format
-            json_data = []
-            for s in services:
-                status_val, _ = s["Status"] if isinstance(s["Status"], tuple) else (s["Status"], "")
-                json_data.append(
-                    {
-                        "service": s["Service"],
-                        "status": status_val,
-                        "pid": s["PID"],
-                        "last_exit": s["Last Exit"],
-                    }
-                )
+            json_data = [
+                {
+                    "service": service_name.display_name,
+                    "status": status.status_str,
+                    "pid": status.pid,
+                    "last_exit": status.last_exit,
+                }
+                for service_name, status in statuses.items()
+            ]
             print_json(json_data)
         else:
-            print_table(services, title="Levi Services")
+            rows = (
+                (
+                    service_name.display_name,
+                    (status.status_str, status.status_color),
+                    str(status.pid) if status.pid else "-",
+                    str(status.last_exit) if status.last_exit is not None else "-",
+                )
+                for service_name, status in statuses.items()
+            )
+            print_rows(
+                rows,
+                [("Service", ""), ("Status", ""), ("PID", ""), ("Last Exit", "")],
+                title="Levi Services",
+            )
 
     except RuntimeError as e:
         print_error(str(e))
@@ -2,12 +2,89 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from dotenv import dotenv_values
+# Allowed values checked by validate()
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+_VALID_TTS_PROVIDERS = frozenset({"vibevoice", "qwen"})
+_VALID_VAD_AGGRESSIVENESS = frozenset({0, 1, 2, 3})
 
+# Parsed .env files by path, with the (mtime_ns, size) they were parsed at
+_ENV_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
 
-@dataclass
+
+def _parse_env(env_path: Path) -> Dict[str, str]:
+    """
+    Parse a .env file.
+
+    Handles the dotenv syntax our .env files use: KEY=value lines, an optional
+    "export " prefix, single- or double-quoted values and # comments (whole
+    line, or after an unquoted value). No escapes or variable expansion.
+
+    Args:
+        env_path: Path to .env file
+
+    Returns:
+        Dict of key to value
+    """
+    env = {}
+    for line in env_path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+
+        value = value.strip()
+        if value[:1] in ("'", '"'):
+            end = value.find(value[0], 1)
+            value = value[1:end] if end != -1 else value[1:]
+        else:
+            # Inline comments need whitespace before the #
+            for marker in (" #", "\t#"):
+                value = value.split(marker, 1)[0]
+            value = value.rstrip()
+
+        env[key.strip()] = value
+
+    return env
+
+
+def _cached_dotenv(env_path: Path) -> Optional[Dict[str, str]]:
+    """
+    Parse a .env file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        env_path: Path to .env file
+
+    Returns:
+        Parsed values (shared, don't mutate), or None if the file doesn't exist
+    """
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _ENV_CACHE.get(env_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    env = _parse_env(env_path)
+    _ENV_CACHE[env_path] = (key, env)
+    return env
+
+
+def _redact(secret: str) -> str:
+    """Mask a secret, keeping its last 4 characters for recognition."""
+    return "********" + secret[-4:]
+
+
+@dataclass(frozen=True)
 class MacConfig:
     """Mac backend configuration."""
 
@@ -18,10 +95,10 @@ class MacConfig:
     @classmethod
     def from_env(cls, env_path: Path) -> "MacConfig":
         """Load configuration from .env file."""
-        if not env_path.exists():
+        env = _cached_dotenv(env_path)
+        if env is None:
             return cls()
 
-        env = dotenv_values(env_path)
         return cls(
             tts_provider=env.get("TTS_PROVIDER"),
             tts_model_path=env.get("TTS_MODEL_PATH"),
@@ -37,10 +114,10 @@ class MacConfig:
         """
         errors = []
 
-        if self.tts_provider and self.tts_provider not in ["vibevoice", "qwen"]:
+        if self.tts_provider and self.tts_provider not in _VALID_TTS_PROVIDERS:
             errors.append(f"Invalid TTS_PROVIDER: {self.tts_provider}")
 
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
+        if self.log_level not in _VALID_LOG_LEVELS:
             errors.append(f"Invalid LOG_LEVEL: {self.log_level}")
 
         return errors
@@ -53,14 +130,25 @@ class MacConfig:
             "LOG_LEVEL": self.log_level,
         }
 
+    def to_dict_raw(self, redact: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary of native values (None when unset), for JSON."""
+        return {
+            "TTS_PROVIDER": self.tts_provider,
+            "TTS_MODEL_PATH": self.tts_model_path,
+            "LOG_LEVEL": self.log_level,
+        }
+
 
-@dataclass
+@dataclass(frozen=True)
 class CloudConfig:
     """Cloud bot configuration."""
 
     telegram_bot_token: Optional[str] = None
     telegram_api_id: Optional[str] = None
     telegram_api_hash: Optional[str] = None
+    telegram_webhook_url: Optional[str] = None
+    telegram_webhook_port: int = 8443
+    telegram_webhook_secret: Optional[str] = None
     mac_websocket_url: Optional[str] = None
     allowed_user_ids: List[str] = field(default_factory=list)
     voice_call_enabled: bool = True
@@ -69,16 +157,21 @@ class CloudConfig:
     default_target_lang: str = "en"
     vad_aggressiveness: int = 2
     silence_duration_ms: int = 500
+    silero_vad_model: Optional[str] = None
+    silero_vad_threshold: float = 0.5
     log_level: str = "INFO"
+    # to_dict() results by redact flag; the config itself never changes
+    _dict_cache: Dict[bool, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_env(cls, env_path: Path) -> "CloudConfig":
         """Load configuration from .env file."""
-        if not env_path.exists():
+        env = _cached_dotenv(env_path)
+        if env is None:
             return cls()
 
-        env = dotenv_values(env_path)
-
         # Parse allowed user IDs
         user_ids = []
         if env.get("ALLOWED_USER_IDS"):
@@ -88,6 +181,9 @@ class CloudConfig:
             telegram_bot_token=env.get("TELEGRAM_BOT_TOKEN"),
             telegram_api_id=env.get("TELEGRAM_API_ID"),
             telegram_api_hash=env.get("TELEGRAM_API_HASH"),
+            telegram_webhook_url=env.get("TELEGRAM_WEBHOOK_URL") or None,
+            telegram_webhook_port=int(env.get("TELEGRAM_WEBHOOK_PORT") or "8443"),
+            telegram_webhook_secret=env.get("TELEGRAM_WEBHOOK_SECRET") or None,
             mac_websocket_url=env.get("MAC_WEBSOCKET_URL"),
             allowed_user_ids=user_ids,
             voice_call_enabled=env.get("VOICE_CALL_ENABLED", "true").lower() == "true",
@@ -96,6 +192,8 @@ class CloudConfig:
             default_target_lang=env.get("DEFAULT_TARGET_LANG", "en"),
             vad_aggressiveness=int(env.get("VAD_AGGRESSIVENESS", "2")),
             silence_duration_ms=int(env.get("SILENCE_DURATION_MS", "500")),
+            silero_vad_model=env.get("SILERO_VAD_MODEL") or None,
+            silero_vad_threshold=float(env.get("SILERO_VAD_THRESHOLD", "0.5")),
             log_level=env.get("LOG_LEVEL", "INFO"),
         )
 
@@ -111,28 +209,45 @@ class CloudConfig:
         if not self.telegram_bot_token:
             errors.append("TELEGRAM_BOT_TOKEN is required")
 
+        if self.telegram_webhook_url and not self.telegram_webhook_url.startswith("https://"):
+            errors.append("TELEGRAM_WEBHOOK_URL must start with https://")
+
         if not self.mac_websocket_url:
             errors.append("MAC_WEBSOCKET_URL is required")
         elif not self.mac_websocket_url.startswith("ws://") and not self.mac_websocket_url.startswith("wss://"):
             errors.append("MAC_WEBSOCKET_URL must start with ws:// or wss://")
 
-        if self.vad_aggressiveness not in [0, 1, 2, 3]:
+        if self.vad_aggressiveness not in _VALID_VAD_AGGRESSIVENESS:
             errors.append("VAD_AGGRESSIVENESS must be 0, 1, 2, or 3")
 
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR"]:
+        if not 0.0 <= self.silero_vad_threshold <= 1.0:
+            errors.append("SILERO_VAD_THRESHOLD must be between 0 and 1")
+
+        if self.log_level not in _VALID_LOG_LEVELS:
             errors.append(f"Invalid LOG_LEVEL: {self.log_level}")
 
         return errors
 
     def to_dict(self, redact: bool = True) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary (built once per instance; treat it as read-only)."""
+        cached = self._dict_cache.get(redact)
+        if cached is None:
+            cached = self._dict_cache[redact] = self._build_dict(redact)
+        return cached
+
+    def _build_dict(self, redact: bool) -> Dict[str, Any]:
+        """Build the display dictionary for to_dict()."""
         token = self.telegram_bot_token or ""
         api_hash = self.telegram_api_hash or ""
+        webhook_secret = self.telegram_webhook_secret or ""
 
         return {
-            "TELEGRAM_BOT_TOKEN": "********" + token[-4:] if (redact and token) else (token or "-"),
+            "TELEGRAM_BOT_TOKEN": _redact(token) if (redact and token) else (token or "-"),
             "TELEGRAM_API_ID": self.telegram_api_id or "-",
-            "TELEGRAM_API_HASH": "********" + api_hash[-4:] if (redact and api_hash) else (api_hash or "-"),
+            "TELEGRAM_API_HASH": _redact(api_hash) if (redact and api_hash) else (api_hash or "-"),
+            "TELEGRAM_WEBHOOK_URL": self.telegram_webhook_url or "-",
+            "TELEGRAM_WEBHOOK_PORT": str(self.telegram_webhook_port),
+            "TELEGRAM_WEBHOOK_SECRET": "********" if (redact and webhook_secret) else (webhook_secret or "-"),
             "MAC_WEBSOCKET_URL": self.mac_websocket_url or "-",
             "ALLOWED_USER_IDS": ", ".join(self.allowed_user_ids) if self.allowed_user_ids else "-",
             "VOICE_CALL_ENABLED": str(self.voice_call_enabled),
@@ -141,5 +256,33 @@ class CloudConfig:
             "DEFAULT_TARGET_LANG": self.default_target_lang,
             "VAD_AGGRESSIVENESS": str(self.vad_aggressiveness),
             "SILENCE_DURATION_MS": str(self.silence_duration_ms),
+            "SILERO_VAD_MODEL": self.silero_vad_model or "-",
+            "SILERO_VAD_THRESHOLD": str(self.silero_vad_threshold),
+            "LOG_LEVEL": self.log_level,
+        }
+
+    def to_dict_raw(self, redact: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary of native values (None when unset), for JSON."""
+        token = self.telegram_bot_token
+        api_hash = self.telegram_api_hash
+        webhook_secret = self.telegram_webhook_secret
+
+        return {
+            "TELEGRAM_BOT_TOKEN": _redact(token) if (redact and token) else (token or None),
+            "TELEGRAM_API_ID": self.telegram_api_id or None,
+            "TELEGRAM_API_HASH": _redact(api_hash) if (redact and api_hash) else (api_hash or None),
+            "TELEGRAM_WEBHOOK_URL": self.telegram_webhook_url,
+            "TELEGRAM_WEBHOOK_PORT": self.telegram_webhook_port,
+            "TELEGRAM_WEBHOOK_SECRET": "********" if (redact and webhook_secret) else (webhook_secret or None),
+            "MAC_WEBSOCKET_URL": self.mac_websocket_url or None,
+            "ALLOWED_USER_IDS": self.allowed_user_ids,
+            "VOICE_CALL_ENABLED": self.voice_call_enabled,
+            "AUTO_JOIN_VOICE_CHATS": self.auto_join_voice_chats,
+            "DEFAULT_SOURCE_LANG": self.default_source_lang,
+            "DEFAULT_TARGET_LANG": self.default_target_lang,
+            "VAD_AGGRESSIVENESS": self.vad_aggressiveness,
+            "SILENCE_DURATION_MS": self.silence_duration_ms,
+            "SILERO_VAD_MODEL": self.silero_vad_model,
+            "SILERO_VAD_THRESHOLD": self.silero_vad_threshold,
             "LOG_LEVEL": self.log_level,
         }
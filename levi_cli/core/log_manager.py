@@ -1,6 +1,9 @@
 """Log file management."""
 
+import io
+import os
 import re
+import select
 import time
 from pathlib import Path
 from typing import Iterator, Optional
@@ -19,6 +22,22 @@ class LogManager:
         "RESET": "\033[0m",  # Reset
     }
 
+    # Log level in any supported format: standalone word (also covers
+    # [INFO]) or followed by a colon (INFO:)
+    _LEVELS = "DEBUG|INFO|WARNING|ERROR|CRITICAL"
+    _LEVEL_RE = re.compile(
+        rf"\b(?P<word>{_LEVELS})\b|(?P<colon>{_LEVELS}):", re.IGNORECASE
+    )
+
+    # Same, for raw lines in follow_batches()
+    _LEVEL_RE_B = re.compile(_LEVEL_RE.pattern.encode(), re.IGNORECASE)
+    _COLORS_BYTES = {key.encode(): value.encode() for key, value in COLORS.items()}
+    _RESET = COLORS["RESET"]
+    _RESET_BYTES = _RESET.encode()
+
+    # Block size for reading log files backwards in tail()
+    TAIL_BLOCK_SIZE = 8192
+
     def __init__(self, logs_dir: Path):
         self.logs_dir = logs_dir
 
@@ -46,14 +65,108 @@ class LogManager:
         if not log_path.exists():
             return []
 
+        if lines <= 0:
+            return []
+
         try:
-            with open(log_path, "r") as f:
-                # Read all lines and get the last N
-                all_lines = f.readlines()
-                return all_lines[-lines:]
+            with open(log_path, "rb") as f:
+                f.seek(self._tail_offset(f, lines))
+                data = f.read()
+            # Split like text-mode readlines(), translating \r\n and \r to \n
+            text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="replace")
+            return text.readlines()[-lines:]
         except Exception:
             return []
 
+    def copy_tail(self, service: str, lines: int, out) -> bool:
+        """
+        Write the last N lines of a log file to a binary stream, uncolorized.
+
+        The bytes are copied with os.sendfile() where the platform allows it
+        (macOS only sends to sockets), otherwise in blocks, without decoding
+        or splitting lines.
+
+        Args:
+            service: Service name ('mac-backend' or 'telegram-bot')
+            lines: Number of lines to write
+            out: Binary stream with a file descriptor, e.g. sys.stdout.buffer
+
+        Returns:
+            False if the log file doesn't exist
+        """
+        try:
+            f = open(self.get_log_path(service), "rb")
+        except OSError:
+            return False
+
+        with f:
+            end = f.seek(0, 2)
+            offset = self._tail_offset(f, lines) if lines > 0 else end
+
+            # Anything already buffered must come before the copied bytes
+            out.flush()
+            try:
+                while offset < end:
+                    sent = os.sendfile(out.fileno(), f.fileno(), offset, end - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                f.seek(offset)
+                while offset < end:
+                    block = f.read(min(self.TAIL_BLOCK_SIZE * 8, end - offset))
+                    if not block:
+                        break
+                    out.write(block)
+                    offset += len(block)
+                out.flush()
+        return True
+
+    def _tail_offset(self, f, lines: int) -> int:
+        """
+        Find where the last N lines of an open binary file start.
+
+        Reads fixed-size blocks backwards from the end, counting line endings
+        the way text-mode readlines() does: \n, \r\n or a lone \r. A line
+        ending at the end of the file closes the last line rather than
+        starting one.
+
+        Args:
+            f: File opened in binary mode
+            lines: Number of lines wanted (at least 1)
+
+        Returns:
+            Byte offset of the first of the last N lines
+        """
+        pos = f.seek(0, 2)
+        remaining = lines
+        at_end = True
+        after = b""  # First byte of the block after the current one
+        while pos > 0:
+            size = min(self.TAIL_BLOCK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+
+            stop = len(block)
+            if at_end and block.endswith((b"\n", b"\r")):
+                stop -= 1
+            at_end = False
+
+            while True:
+                idx = max(block.rfind(b"\n", 0, stop), block.rfind(b"\r", 0, stop))
+                if idx == -1:
+                    break
+                stop = idx
+                # The \r of a \r\n pair was counted with its \n
+                if block[idx] == 0x0D and (block[idx + 1:idx + 2] or after) == b"\n":
+                    continue
+                remaining -= 1
+                if remaining == 0:
+                    return pos + idx + 1
+            after = block[:1]
+        return 0
+
     def follow(self, service: str, colorize: bool = True) -> Iterator[str]:
         """
         Follow a log file (like tail -f).
@@ -65,26 +178,150 @@ class LogManager:
         Yields:
             Log lines as they're written
         """
+        for batch in self._follow_raw(service):
+            for raw_line in batch:
+                line = raw_line.decode("utf-8", errors="replace")
+                if colorize:
+                    line = self.colorize_line(line)
+
+                yield line
+
+    def follow_batches(self, service: str, colorize: bool = True) -> Iterator[bytes]:
+        """
+        Follow a log file, yielding everything written since the last wakeup at once.
+
+        Works on raw bytes end to end, so callers can write each batch straight
+        to a binary stream (and flush once) without decoding or re-encoding.
+
+        Args:
+            service: Service name
+            colorize: Whether to add color codes
+
+        Yields:
+            Raw log data as it's written, in whole-batch chunks
+        """
+        for batch in self._follow_raw(service):
+            if colorize:
+                batch = [self.colorize_line_bytes(line) for line in batch]
+
+            yield b"".join(batch)
+
+    def _follow_raw(self, service: str) -> Iterator[list[bytes]]:
+        """Follow a log file, yielding the raw lines available at each wakeup."""
         log_path = self.get_log_path(service)
 
-        # Wait for log file to exist if it doesn't
-        while not log_path.exists():
-            time.sleep(0.5)
+        # Block on kqueue file events where available (macOS/BSD), else poll
+        if hasattr(select, "kqueue") and log_path.parent.exists():
+            return self._follow_kqueue(log_path)
+        return self._follow_poll(log_path)
 
-        with open(log_path, "r") as f:
-            # Move to end of file
-            f.seek(0, 2)
+    def _follow_poll(self, log_path: Path) -> Iterator[list[bytes]]:
+        """Follow a log file by polling for new data."""
+        seek_end = True
+        while True:
+            # Wait for log file to exist if it doesn't
+            while not log_path.exists():
+                time.sleep(0.5)
 
-            while True:
-                line = f.readline()
-                if not line:
+            with open(log_path, "rb") as f:
+                # Move to end of file; a rotated-in file is read from the start
+                if seek_end:
+                    f.seek(0, 2)
+                    seek_end = False
+
+                while True:
+                    lines = f.readlines()
+                    if lines:
+                        yield lines
+                        continue
+
+                    if self._reopen_needed(log_path, f):
+                        break
                     time.sleep(0.1)
-                    continue
 
-                if colorize:
-                    line = self.colorize_line(line)
+    def _follow_kqueue(self, log_path: Path) -> Iterator[list[bytes]]:
+        """Follow a log file, sleeping in kqueue until it is written to."""
+        kq = select.kqueue()
+        # Event-only descriptor (macOS): watches the directory without
+        # keeping its volume busy
+        dir_fd = os.open(log_path.parent, getattr(os, "O_EVTONLY", os.O_RDONLY))
+        try:
+            # Creating (or rotating in) the log writes to the directory
+            kq.control([self._vnode_event(dir_fd, select.KQ_NOTE_WRITE)], 0, 0)
 
-                yield line
+            seek_end = True
+            while True:
+                # Wait for log file to exist if it doesn't
+                while not log_path.exists():
+                    kq.control(None, 1, None)
+
+                with open(log_path, "rb") as f:
+                    # Move to end of file; a rotated-in file is read from the start
+                    if seek_end:
+                        f.seek(0, 2)
+                        seek_end = False
+
+                    # Wake on appends, and on the file being rotated away
+                    kq.control(
+                        [self._vnode_event(
+                            f.fileno(),
+                            select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND
+                            | select.KQ_NOTE_RENAME | select.KQ_NOTE_DELETE,
+                        )],
+                        0,
+                        0,
+                    )
+
+                    while True:
+                        lines = f.readlines()
+                        if lines:
+                            yield lines
+                            continue
+
+                        pos = f.tell()
+                        if self._reopen_needed(log_path, f):
+                            break
+                        if f.tell() != pos:
+                            # Rewound after truncation; the write that woke us
+                            # was already consumed, so read before blocking
+                            continue
+                        # Events since registration stay queued, so none are missed
+                        kq.control(None, 1, None)
+        finally:
+            os.close(dir_fd)
+            kq.close()
+
+    @staticmethod
+    def _reopen_needed(log_path: Path, f) -> bool:
+        """
+        Check a drained log file for rotation or truncation.
+
+        Only called once the open file is read to its end, so no data is lost
+        when switching. Truncation (copytruncate) is handled in place by
+        rewinding.
+
+        Returns:
+            True if log_path no longer refers to the open file
+        """
+        st = os.fstat(f.fileno())
+        if st.st_size < f.tell():
+            f.seek(0)
+            return False
+
+        try:
+            return os.stat(log_path).st_ino != st.st_ino
+        except FileNotFoundError:
+            return True
+
+    @staticmethod
+    def _vnode_event(fd: int, fflags: int):
+        """Build an edge-triggered kqueue vnode event for fd."""
+        return select.kevent(
+            fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=fflags,
+        )
 
     def colorize_line(self, line: str) -> str:
         """
@@ -96,37 +333,40 @@ class LogManager:
         Returns:
             Colored log line
         """
-        # Try to detect log level in the line
-        for level, color in self.COLORS.items():
-            if level == "RESET":
-                continue
+        # Detect the first log level in the line with a single search
+        match = self._LEVEL_RE.search(line)
+        if match:
+            # lastindex is whichever of the two groups matched
+            level = match[match.lastindex].upper()
+            return f"{self.COLORS[level]}{line}{self._RESET}"
 
-            # Look for log level in various formats
-            patterns = [
-                rf"\b{level}\b",  # Standalone word
-                rf"\[{level}\]",  # [INFO]
-                rf"{level}:",  # INFO:
-            ]
+        # Default: no color
+        return line
 
-            for pattern in patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    return f"{color}{line}{self.COLORS['RESET']}"
+    def colorize_line_bytes(self, line: bytes) -> bytes:
+        """
+        Add ANSI color codes to a raw log line based on level.
+
+        Args:
+            line: Log line as bytes
+
+        Returns:
+            Colored log line as bytes
+        """
+        match = self._LEVEL_RE_B.search(line)
+        if match:
+            level = match[match.lastindex].upper()
+            return self._COLORS_BYTES[level] + line + self._RESET_BYTES
 
         # Default: no color
         return line
 
     def get_all_services(self) -> list[str]:
         """Get list of all services with log files."""
-        if not self.logs_dir.exists():
-            return []
-
-        services = []
-        for log_file in self.logs_dir.glob("*.log"):
-            service_name = log_file.stem
-            # Convert filename to service name format
-            if service_name == "mac-backend":
-                services.append("mac-backend")
-            elif service_name == "telegram-bot":
-                services.append("telegram-bot")
-
-        return services
+        # Only the known services have logs, so check for them directly
+        # instead of listing the directory
+        return [
+            service
+            for service in ("mac-backend", "telegram-bot")
+            if self.get_log_path(service).exists()
+        ]
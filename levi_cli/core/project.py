@@ -1,8 +1,15 @@
 """Project discovery and path management."""
 
+import functools
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Entries that together identify a Levi checkout without reading any file
+_CHECKOUT_MARKERS = frozenset({"CLAUDE.md", ".git", "mac", "cloud"})
+
+# Project roots found so far, by resolved starting directory
+_ROOT_CACHE: Dict[str, Path] = {}
 
 
 class ProjectPaths:
@@ -34,35 +41,56 @@ def find_project_root(start_path: Optional[Path] = None) -> Optional[Path]:
     Returns:
         Path to project root, or None if not found
     """
-    if start_path is None:
-        start_path = Path.cwd()
+    start = os.path.realpath(os.getcwd() if start_path is None else os.fspath(start_path))
+
+    # Keyed on the resolved directory, so a changed CWD is searched afresh.
+    # Only found roots are cached; a failed search is retried next time.
+    root = _ROOT_CACHE.get(start)
+    if root is None:
+        root = _search_project_root(start)
+        if root is not None:
+            _ROOT_CACHE[start] = root
+    return root
+
 
-    current = start_path.resolve()
-    home = Path.home()
+def _search_project_root(current: str) -> Optional[Path]:
+    """
+    Walk up from a resolved directory to the project root.
+
+    The walk uses plain strings and os.path; only the result becomes a Path.
+    """
+    # Directories compare component-wise, as Path objects do
+    home_parts = os.path.normpath(os.path.expanduser("~")).split(os.sep)
 
     # Search upwards until we hit home directory
-    while current >= home:
-        pyproject = current / "pyproject.toml"
-        if pyproject.exists():
+    while current.split(os.sep) >= home_parts:
+        # One directory listing answers every marker check below
+        try:
+            with os.scandir(current) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
+
+        # A checkout is recognized from its entries; pyproject.toml is
+        # only read for directories that don't look like one
+        if _CHECKOUT_MARKERS <= names:
+            return Path(current)
+
+        if "pyproject.toml" in names:
             # Check if this is the levi project
             try:
-                content = pyproject.read_text()
-                if 'name = "levi"' in content:
-                    return current
+                # The marker is ASCII, so the raw bytes are searched undecoded
+                with open(os.path.join(current, "pyproject.toml"), "rb") as f:
+                    content = f.read()
+                if b'name = "levi"' in content:
+                    return Path(current)
             except Exception:
                 pass
 
-        # Also check for .git as a fallback indicator
-        git_dir = current / ".git"
-        claude_md = current / "CLAUDE.md"
-        if git_dir.exists() and claude_md.exists():
-            # Verify this looks like the levi project
-            if (current / "mac").exists() and (current / "cloud").exists():
-                return current
-
-        if current == current.parent:
+        parent = os.path.dirname(current)
+        if parent == current:
             break
-        current = current.parent
+        current = parent
 
     return None
 
@@ -75,7 +103,7 @@ def get_project_paths(start_path: Optional[Path] = None) -> ProjectPaths:
         start_path: Directory to start searching from (defaults to CWD)
 
     Returns:
-        ProjectPaths object
+        ProjectPaths object (shared between calls; don't modify it)
 
     Raises:
         RuntimeError: If project root cannot be found
@@ -86,4 +114,10 @@ def get_project_paths(start_path: Optional[Path] = None) -> ProjectPaths:
             "Could not find Levi project root. "
             "Make sure you're running this command from within the Levi project directory."
         )
+    return _project_paths(root)
+
+
+@functools.cache
+def _project_paths(root: Path) -> ProjectPaths:
+    """Build the paths for a project root once."""
     return ProjectPaths(root)
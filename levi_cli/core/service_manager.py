@@ -1,5 +1,7 @@
 """LaunchAgent service management."""
 
+import functools
+import io
 import os
 import re
 import shutil
@@ -10,6 +12,12 @@ from pathlib import Path
 from typing import Optional
 
 
+_DISPLAY_NAMES = {
+    "com.levi.mac-backend": "Mac Backend",
+    "com.levi.telegram-bot": "Telegram Bot",
+}
+
+
 class ServiceName(Enum):
     """Available services."""
 
@@ -19,11 +27,7 @@ class ServiceName(Enum):
     @property
     def display_name(self) -> str:
         """Human-readable service name."""
-        names = {
-            self.MAC_BACKEND: "Mac Backend",
-            self.TELEGRAM_BOT: "Telegram Bot",
-        }
-        return names[self]
+        return _DISPLAY_NAMES[self.value]
 
 
 @dataclass
@@ -40,7 +44,7 @@ class ServiceStatus:
         """Check if service is currently running."""
         return self.loaded and self.pid is not None and self.pid > 0
 
-    @property
+    @functools.cached_property
     def status_str(self) -> str:
         """Human-readable status string."""
         if not self.loaded:
@@ -52,7 +56,7 @@ class ServiceStatus:
         else:
             return "running"
 
-    @property
+    @functools.cached_property
     def status_color(self) -> str:
         """Color for rich output."""
         if self.is_running:
@@ -70,18 +74,31 @@ class LaunchAgentManager:
         self.project_root = project_root
         self.plist_dir = Path.home() / "Library" / "LaunchAgents"
         self.domain = f"gui/{os.getuid()}"
+        # Parsed `launchctl list`, shared by status queries until invalidated
+        self._list_cache: Optional[dict[str, tuple[Optional[int], Optional[int]]]] = None
 
-    def get_status(self, service: ServiceName) -> ServiceStatus:
-        """
-        Get service status via launchctl list.
+    def invalidate_list_cache(self):
+        """Forget the cached launchctl listing so the next status query refetches it."""
+        self._list_cache = None
 
-        Args:
-            service: Service to check
+    def refresh_list_cache(self):
+        """Fetch a fresh launchctl listing for the status checks that follow."""
+        self.invalidate_list_cache()
+        try:
+            self._load_list()
+        except Exception:
+            # get_status() retries, and reports services as not loaded
+            pass
+
+    def _load_list(self) -> dict[str, tuple[Optional[int], Optional[int]]]:
+        """
+        Run `launchctl list` once and index it by label.
 
         Returns:
-            ServiceStatus object
+            Dict of label to (PID, last exit status); either is None when
+            launchctl shows "-"
         """
-        try:
+        if self._list_cache is None:
             result = subprocess.run(
                 ["launchctl", "list"],
                 capture_output=True,
@@ -89,42 +106,64 @@ class LaunchAgentManager:
                 check=False,
             )
 
-            # Parse output to find our service
-            # Format: PID    Status    Label
-            for line in result.stdout.splitlines():
-                if service.value in line:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        pid_str = parts[0]
-                        status_str = parts[1]
-
-                        # Parse PID (might be "-" if not running)
-                        pid = None
-                        if pid_str.isdigit():
-                            pid = int(pid_str)
-
-                        # Parse last exit code
-                        last_exit = None
-                        if status_str.isdigit():
-                            last_exit = int(status_str)
-
-                        return ServiceStatus(
-                            name=service, loaded=True, pid=pid, last_exit=last_exit
-                        )
+            # Format: PID    Status    Label, after a header line. Splitting
+            # at most twice keeps the label whole. Lines are read off the
+            # output one at a time rather than split into a list up front
+            listing = {}
+            lines = io.StringIO(result.stdout)
+            next(lines, None)
+            for line in lines:
+                parts = line.split(None, 2)
+                if len(parts) == 3:
+                    pid_str, status_str = parts[0], parts[1]
+                    listing[parts[2].rstrip()] = (
+                        int(pid_str) if pid_str.isdigit() else None,
+                        int(status_str) if status_str.isdigit() else None,
+                    )
+            self._list_cache = listing
+        return self._list_cache
 
-            # Service not found in list - not loaded
-            return ServiceStatus(name=service, loaded=False, pid=None, last_exit=None)
+    def get_status(self, service: ServiceName) -> ServiceStatus:
+        """
+        Get service status via launchctl list.
 
-        except Exception as e:
+        Args:
+            service: Service to check
+
+        Returns:
+            ServiceStatus object
+        """
+        try:
+            entry = self._load_list().get(service.value)
+        except Exception:
             # If we can't run launchctl, assume not loaded
+            entry = None
+
+        if entry is None:
+            # Service not found in list - not loaded
             return ServiceStatus(name=service, loaded=False, pid=None, last_exit=None)
 
-    def start(self, service: ServiceName) -> tuple[bool, str]:
+        pid, last_exit = entry
+        return ServiceStatus(name=service, loaded=True, pid=pid, last_exit=last_exit)
+
+    def get_all_statuses(self) -> dict[ServiceName, ServiceStatus]:
+        """
+        Get the status of every service from one fresh launchctl listing.
+
+        Returns:
+            Dict of service to ServiceStatus, in ServiceName order
+        """
+        self.invalidate_list_cache()
+        return {service: self.get_status(service) for service in ServiceName}
+
+    def start(self, service: ServiceName, *, refresh: bool = True) -> tuple[bool, str]:
         """
         Bootstrap (load and start) service.
 
         Args:
             service: Service to start
+            refresh: Refetch the launchctl listing first; pass False when the
+                caller has just refreshed it for several services
 
         Returns:
             Tuple of (success, message)
@@ -135,11 +174,13 @@ class LaunchAgentManager:
             return False, f"Plist not found: {plist_path}. Run 'levi deploy setup' first."
 
         # Check if already loaded
+        if refresh:
+            self.invalidate_list_cache()
         status = self.get_status(service)
         if status.loaded:
             # If loaded but not running, use kickstart
             if not status.is_running:
-                return self.restart(service)
+                return self.restart(service, refresh=False)
             return True, f"{service.display_name} is already running"
 
         try:
@@ -158,16 +199,20 @@ class LaunchAgentManager:
         except Exception as e:
             return False, f"Error starting {service.display_name}: {str(e)}"
 
-    def stop(self, service: ServiceName) -> tuple[bool, str]:
+    def stop(self, service: ServiceName, *, refresh: bool = True) -> tuple[bool, str]:
         """
         Bootout (unload) service.
 
         Args:
             service: Service to stop
+            refresh: Refetch the launchctl listing first; pass False when the
+                caller has just refreshed it for several services
 
         Returns:
             Tuple of (success, message)
         """
+        if refresh:
+            self.invalidate_list_cache()
         status = self.get_status(service)
         if not status.loaded:
             return True, f"{service.display_name} is not running"
@@ -188,20 +233,24 @@ class LaunchAgentManager:
         except Exception as e:
             return False, f"Error stopping {service.display_name}: {str(e)}"
 
-    def restart(self, service: ServiceName) -> tuple[bool, str]:
+    def restart(self, service: ServiceName, *, refresh: bool = True) -> tuple[bool, str]:
         """
         Restart service (kill and let LaunchAgent restart it).
 
         Args:
             service: Service to restart
+            refresh: Refetch the launchctl listing first; pass False when the
+                caller has just refreshed it for several services
 
         Returns:
             Tuple of (success, message)
         """
+        if refresh:
+            self.invalidate_list_cache()
         status = self.get_status(service)
         if not status.loaded:
             # Not loaded, try to start it
-            return self.start(service)
+            return self.start(service, refresh=False)
 
         try:
             result = subprocess.run(
@@ -263,10 +312,8 @@ class LaunchAgentManager:
             return True, f"{service.display_name} plist not installed"
 
         try:
-            # Make sure service is stopped first
-            status = self.get_status(service)
-            if status.loaded:
-                self.stop(service)
+            # Make sure service is stopped first (stop() checks the status)
+            self.stop(service)
 
             # Remove plist
             plist_path.unlink()
@@ -1,16 +1,37 @@
 """Main CLI entry point."""
 
+import importlib
+
 import click
-from rich.console import Console
 
 from levi_cli.core.project import get_project_paths
-from levi_cli.core.service_manager import LaunchAgentManager, ServiceName
-from levi_cli.utils.output import print_error, print_table
+from levi_cli.core.service_manager import LaunchAgentManager
+from levi_cli.utils.output import get_console, print_error, print_rows
+
+
+class LazyGroup(click.Group):
+    """Click group whose command groups are imported only when invoked."""
+
+    # Command name -> "module:attribute"
+    LAZY_COMMANDS = {
+        "config": "levi_cli.commands.config:config",
+        "logs": "levi_cli.commands.logs:logs",
+        "services": "levi_cli.commands.services:services",
+    }
+
+    def list_commands(self, ctx):
+        return sorted([*super().list_commands(ctx), *self.LAZY_COMMANDS])
 
-console = Console()
+    def get_command(self, ctx, cmd_name):
+        target = self.LAZY_COMMANDS.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
 
+        module_name, attr = target.split(":")
+        return getattr(importlib.import_module(module_name), attr)
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.pass_context
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 def cli(ctx, verbose):
@@ -55,37 +76,36 @@ def status(ctx, output_json):
         # Create service manager
         manager = LaunchAgentManager(paths.root)
 
-        # Get status for all services
-        services = []
-        for service_name in ServiceName:
-            status = manager.get_status(service_name)
-            services.append(
-                {
-                    "Service": service_name.display_name,
-                    "Status": (status.status_str, status.status_color),
-                    "PID": str(status.pid) if status.pid else "-",
-                    "Last Exit": str(status.last_exit) if status.last_exit is not None else "-",
-                }
-            )
+        statuses = manager.get_all_statuses()
 
         if output_json:
-            # Convert to JSON-friendly format
-            json_data = []
-            for s in services:
-                status_val, _ = s["Status"] if isinstance(s["Status"], tuple) else (s["Status"], "")
-                json_data.append(
-                    {
-                        "service": s["Service"],
-                        "status": status_val,
-                        "pid": s["PID"],
-                        "last_exit": s["Last Exit"],
-                    }
-                )
+            json_data = [
+                {
+                    "service": service_name.display_name,
+                    "status": status.status_str,
+                    "pid": status.pid,
+                    "last_exit": status.last_exit,
+                }
+                for service_name, status in statuses.items()
+            ]
             from levi_cli.utils.output import print_json
 
             print_json(json_data)
         else:
-            print_table(services, title="Levi Services")
+            rows = (
+                (
+                    service_name.display_name,
+                    (status.status_str, status.status_color),
+                    str(status.pid) if status.pid else "-",
+                    str(status.last_exit) if status.last_exit is not None else "-",
+                )
+                for service_name, status in statuses.items()
+            )
+            print_rows(
+                rows,
+                [("Service", ""), ("Status", ""), ("PID", ""), ("Last Exit", "")],
+                title="Levi Services",
+            )
 
     except RuntimeError as e:
         print_error(str(e))
@@ -93,19 +113,9 @@ def status(ctx, output_json):
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")
         if ctx.obj.get("verbose"):
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
 
 
-# Import command groups
-from levi_cli.commands.services import services
-from levi_cli.commands.config import config
-from levi_cli.commands.logs import logs
-
-cli.add_command(services)
-cli.add_command(config)
-cli.add_command(logs)
-
-
 if __name__ == "__main__":
     cli()
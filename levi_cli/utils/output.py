@@ -1,18 +1,33 @@
 """Output formatting utilities."""
 
+import functools
 import json
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
 
-from rich.console import Console
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
 
-console = Console()
+@functools.cache
+def get_console() -> "Console":
+    """
+    Get the shared rich console.
+
+    rich is imported on first use, so commands that only print JSON or
+    plain text don't pay for it at startup.
+
+    Returns:
+        Console instance
+    """
+    from rich.console import Console
+
+    return Console()
 
 
 def format_table(
     data: List[Dict[str, Any]], title: str = "", columns: List[tuple[str, str]] = None
-) -> Table:
+) -> "Table":
     """
     Format data as a rich table.
 
@@ -24,6 +39,8 @@ def format_table(
     Returns:
         Rich Table object
     """
+    from rich.table import Table
+
     table = Table(title=title, show_header=True, header_style="bold cyan")
 
     if not data:
@@ -37,23 +54,51 @@ def format_table(
     for col_name, style in columns:
         table.add_column(col_name, style=style)
 
-    # Add rows
+    # Add rows; a row missing a column gets an empty cell
+    col_names = [col_name for col_name, _ in columns]
+    get_cell = _format_cell
     for row in data:
-        values = []
-        for col_name, _ in columns:
-            value = row.get(col_name, "")
-            # Handle color markup
-            if isinstance(value, tuple):
-                # (value, color) tuple
-                text, color = value
-                values.append(f"[{color}]{text}[/{color}]")
-            else:
-                values.append(str(value))
-        table.add_row(*values)
+        get = row.get
+        table.add_row(*[get_cell(get(col_name, "")) for col_name in col_names])
 
     return table
 
 
+def format_rows(
+    rows: Iterable[Sequence[Any]], columns: List[tuple[str, str]], title: str = ""
+) -> "Table":
+    """
+    Format rows whose values are already in column order as a rich table.
+
+    Args:
+        rows: Row values, in the same order as columns
+        columns: List of (column_name, style) tuples
+        title: Optional table title
+
+    Returns:
+        Rich Table object
+    """
+    from rich.table import Table
+
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+
+    for col_name, style in columns:
+        table.add_column(col_name, style=style)
+
+    for row in rows:
+        table.add_row(*[_format_cell(value) for value in row])
+
+    return table
+
+
+def _format_cell(value: Any) -> str:
+    """Render a cell value; a (value, color) tuple becomes color markup."""
+    if isinstance(value, tuple):
+        text, color = value
+        return f"[{color}]{text}[/{color}]"
+    return str(value)
+
+
 def print_table(
     data: List[Dict[str, Any]], title: str = "", columns: List[tuple[str, str]] = None
 ):
@@ -66,7 +111,21 @@ def print_table(
         columns: List of (column_name, style) tuples
     """
     table = format_table(data, title, columns)
-    console.print(table)
+    get_console().print(table)
+
+
+def print_rows(
+    rows: Iterable[Sequence[Any]], columns: List[tuple[str, str]], title: str = ""
+):
+    """
+    Print rows as a rich table to console.
+
+    Args:
+        rows: Row values, in the same order as columns
+        columns: List of (column_name, style) tuples
+        title: Optional table title
+    """
+    get_console().print(format_rows(rows, columns, title))
 
 
 def print_json(data: Any, pretty: bool = True):
@@ -90,7 +149,7 @@ def print_error(message: str):
     Args:
         message: Error message
     """
-    console.print(f"[red]Error:[/red] {message}")
+    get_console().print(f"[red]Error:[/red] {message}")
 
 
 def print_success(message: str):
@@ -100,7 +159,7 @@ def print_success(message: str):
     Args:
         message: Success message
     """
-    console.print(f"[green]✓[/green] {message}")
+    get_console().print(f"[green]✓[/green] {message}")
 
 
 def print_warning(message: str):
@@ -110,7 +169,7 @@ def print_warning(message: str):
     Args:
         message: Warning message
     """
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    get_console().print(f"[yellow]⚠[/yellow] {message}")
 
 
 def print_info(message: str):
@@ -120,7 +179,7 @@ def print_info(message: str):
     Args:
         message: Info message
     """
-    console.print(f"[blue]ℹ[/blue] {message}")
+    get_console().print(f"[blue]ℹ[/blue] {message}")
 
 
 def print_key_value(key: str, value: Any, redacted: bool = False):
@@ -137,4 +196,4 @@ def print_key_value(key: str, value: Any, redacted: bool = False):
     else:
         value_str = str(value)
 
-    console.print(f"[cyan]{key}:[/cyan] {value_str}")
+    get_console().print(f"[cyan]{key}:[/cyan] {value_str}")
@@ -44,24 +44,32 @@ def demo_streaming():
     print("🎙️  Starting streaming generation...\n")
     print("Progress:")
 
-    chunks = []
+    # Chunks go straight to disk as they arrive instead of piling up in memory
+    import tempfile
+    output_file = Path(tempfile.gettempdir()) / "streaming_demo_output.wav"
+
+    chunk_count = 0
+    total_bytes = 0
     start = time.time()
     first_chunk_time = None
 
-    for i, chunk in enumerate(tts.synthesize_streaming(
-        text=test_text,
-        language="en",
-        streaming_interval=1.5
-    )):
-        if i == 0:
-            first_chunk_time = time.time() - start
-            print(f"  ⚡ First chunk: {first_chunk_time*1000:.0f}ms")
+    with open(output_file, "wb") as f:
+        for i, chunk in enumerate(tts.synthesize_streaming(
+            text=test_text,
+            language="en",
+            streaming_interval=1.5
+        )):
+            if i == 0:
+                first_chunk_time = time.time() - start
+                print(f"  ⚡ First chunk: {first_chunk_time*1000:.0f}ms")
 
-        chunks.append(chunk)
+            f.write(chunk)
+            chunk_count += 1
+            total_bytes += len(chunk)
 
-        # Visual progress bar
-        progress = "█" * (i + 1)
-        print(f"  {progress} Chunk {i}: {len(chunk):,} bytes")
+            # Visual progress bar
+            progress = "█" * (i + 1)
+            print(f"  {progress} Chunk {i}: {len(chunk):,} bytes")
 
     total_time = time.time() - start
 
@@ -69,21 +77,13 @@ def demo_streaming():
     print(f"\n{'='*60}")
     print(f"RESULTS")
     print(f"{'='*60}")
-    print(f"Total chunks:        {len(chunks)}")
-    print(f"Total bytes:         {sum(len(c) for c in chunks):,}")
+    print(f"Total chunks:        {chunk_count}")
+    print(f"Total bytes:         {total_bytes:,}")
     print(f"Time to first chunk: {first_chunk_time*1000:.0f}ms")
     print(f"Total time:          {total_time*1000:.0f}ms")
-    print(f"Average per chunk:   {(total_time / len(chunks))*1000:.0f}ms")
+    print(f"Average per chunk:   {(total_time / chunk_count)*1000:.0f}ms")
     print(f"{'='*60}")
 
-    # Save combined audio
-    import tempfile
-    output_file = Path(tempfile.gettempdir()) / "streaming_demo_output.wav"
-
-    with open(output_file, "wb") as f:
-        for chunk in chunks:
-            f.write(chunk)
-
     print(f"\n💾 Saved audio to: {output_file}")
     print(f"\nPlay with:")
     print(f"  afplay {output_file}")
@@ -120,16 +120,15 @@ def compare_batch_vs_streaming():
 
         start = time.time()
         first_chunk_time = None
-        chunks = []
 
-        for i, chunk in enumerate(tts.synthesize_streaming(
+        # Only the timing matters here, so chunks are dropped as they arrive
+        for i, _ in enumerate(tts.synthesize_streaming(
             text=test_text,
             language="en",
             streaming_interval=1.0
         )):
             if i == 0:
                 first_chunk_time = time.time() - start
-            chunks.append(chunk)
 
         total_time = time.time() - start
 
@@ -5,14 +5,23 @@ Uses cloud API - no local model, no memory usage, excellent quality.
 Free tier: 500k characters/month
 """
 import os
-from typing import Optional
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Add src to path (also when run directly as a script)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from wire_codecs import json_dumpb, json_loads
+
 
 class DeepLTranslationClient:
     """
@@ -32,6 +41,9 @@ class DeepLTranslationClient:
     API_BASE_URL = "https://api-free.deepl.com/v2"  # Free tier
     # API_BASE_URL = "https://api.deepl.com/v2"  # Pro tier
 
+    MAX_TEXTS_PER_REQUEST = 50  # Most texts DeepL accepts in one request
+    CACHE_SIZE = 1024  # Recent single-text translations kept in memory
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize DeepL translation client.
@@ -54,8 +66,34 @@ class DeepLTranslationClient:
                 "Get free API key at: https://www.deepl.com/pro-api"
             )
 
+        # Pooled session: after the first request, calls reuse the open
+        # TLS connection instead of paying a new handshake each time
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self._session.headers.update({
+            "Authorization": f"DeepL-Auth-Key {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # Repeated phrases are answered locally, saving a round-trip and quota
+        self._translate_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._translate_uncached)
+
         print(f"✓ DeepL API client initialized (cloud-based, no local memory)")
 
+    def close(self):
+        """Close pooled connections to the DeepL API."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def cache_clear(self):
+        """Forget cached translations."""
+        self._translate_cached.cache_clear()
+
     def translate(self, text: str, source_lang: str = "es", target_lang: str = "en") -> str:
         """
         Translate text using DeepL API.
@@ -68,6 +106,31 @@ class DeepLTranslationClient:
         Returns:
             Translated text
         """
+        src_code, tgt_code = self._lang_codes(source_lang, target_lang)
+        return self._translate_cached(text, src_code, tgt_code)
+
+    def translate_batch(
+        self, texts: List[str], source_lang: str = "es", target_lang: str = "en"
+    ) -> List[str]:
+        """
+        Translate several texts, up to 50 per DeepL API request.
+
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code (es or en)
+            target_lang: Target language code (en or es)
+
+        Returns:
+            Translated texts, in the same order
+        """
+        if not texts:
+            return []
+
+        src_code, tgt_code = self._lang_codes(source_lang, target_lang)
+        return self._translate_texts(texts, src_code, tgt_code)
+
+    def _lang_codes(self, source_lang: str, target_lang: str) -> Tuple[str, str]:
+        """Map language codes to DeepL's, rejecting unsupported pairs."""
         src_code = self.LANG_CODES.get(source_lang)
         tgt_code = self.LANG_CODES.get(target_lang)
 
@@ -76,26 +139,54 @@ class DeepLTranslationClient:
                 f"Unsupported language pair: {source_lang} -> {target_lang}\n"
                 f"Supported: {list(self.LANG_CODES.keys())}"
             )
+        return src_code, tgt_code
+
+    def _translate_uncached(self, text: str, src_code: str, tgt_code: str) -> str:
+        """Translate one text with an API call (wrapped by the translation cache)."""
+        return self._translate_texts([text], src_code, tgt_code)[0]
+
+    def _translate_texts(self, texts: List[str], src_code: str, tgt_code: str) -> List[str]:
+        """Translate texts between DeepL language codes, batching requests."""
+        batch_size = self.MAX_TEXTS_PER_REQUEST
+        if len(texts) <= batch_size:
+            # One request covers it (always the case for translate())
+            return [t["text"].strip() for t in self._post(texts, src_code, tgt_code)]
+
+        translations = []
+        for start in range(0, len(texts), batch_size):
+            translations += [
+                t["text"].strip()
+                for t in self._post(texts[start:start + batch_size], src_code, tgt_code)
+            ]
+        return translations
+
+    def _post(self, texts: List[str], src_code: str, tgt_code: str) -> List[dict]:
+        """
+        Call the DeepL translate endpoint.
+
+        Args:
+            texts: Texts to translate, at most MAX_TEXTS_PER_REQUEST
+            src_code: DeepL source language code
+            tgt_code: DeepL target language code
 
-        # Call DeepL API
+        Returns:
+            The response's translations, one {"text": ...} entry per text
+        """
         url = f"{self.API_BASE_URL}/translate"
-        headers = {
-            "Authorization": f"DeepL-Auth-Key {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        payload = {
-            "text": [text],
-            "source_lang": src_code,
-            "target_lang": tgt_code
-        }
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            # Content-Type is already set on the session
+            response = self._session.post(
+                url,
+                data=json_dumpb({
+                    "text": texts,
+                    "source_lang": src_code,
+                    "target_lang": tgt_code
+                }),
+                timeout=10,
+            )
             response.raise_for_status()
-
-            result = response.json()
-            translation = result["translations"][0]["text"]
-            return translation.strip()
+            return json_loads(response.content)["translations"]
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
@@ -164,6 +255,15 @@ def main():
     print(f"DeepL translation: {translation}")
     print("(Note: garbage in, garbage out - but at least it won't hallucinate!)\n")
 
+    # Test 5: Several phrases in one request
+    print("=" * 60)
+    print("Test 5: Batch Spanish → English (one request)")
+    phrases = ["Buenos días", "Gracias por su ayuda", "¿Dónde está la estación?"]
+    for phrase, translated in zip(phrases, client.translate_batch(phrases, "es", "en")):
+        print(f"ES: {phrase}")
+        print(f"EN: {translated}")
+    print()
+
     print("=" * 60)
     print("✓ All tests complete!")
 
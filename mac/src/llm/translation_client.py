@@ -2,9 +2,62 @@
 Translation client using MLX-optimized Qwen model.
 Handles Spanish <-> English translation via local LLM.
 """
-from mlx_lm import load, generate
+import re
 from pathlib import Path
 
+from mlx_lm import load, generate
+
+# Prompt text before and after the input, per (source, target) language pair.
+# Be VERY explicit about what language the input is in
+_PROMPTS = {
+    ("es", "en"): ('Translate this Spanish to English: "', '"\n\nEnglish translation:'),
+    ("en", "es"): ('Translate this English to Spanish: "', '"\n\nSpanish translation:'),
+}
+
+# Output cleanup patterns, compiled once at import
+
+# A quoted translation attempt inside a complaint about the input
+_QUOTED = re.compile(r'"([^"]+)"')
+
+# Common explanation patterns that start the response
+_EXPLANATION_STARTS = (
+    r'The given Spanish text\s+"[^"]*"?\s*',
+    r'The given English text\s+"[^"]*"?\s*',
+    r'The Spanish text\s+"[^"]*"?\s*',
+    r'The English text\s+"[^"]*"?\s*',
+    r'This Spanish text\s+"[^"]*"?\s*',
+    r'This English text\s+"[^"]*"?\s*',
+    r'Spanish translation:\s*',
+    r'English translation:\s*',
+)
+
+# Transition phrases like "translates to X as:", "means:", etc.
+_TRANSITIONS = (
+    r'translates? to \w+ as:\s*',
+    r'means:\s*',
+    r'is:\s*',
+    r'says:\s*',
+    r'seems to\s+.*?[.!?]\s*',
+    r'appears to\s+.*?[.!?]\s*',
+)
+
+# All of the above as one anchored pattern: each phrase is optional and
+# tried in list order, which strips the same prefixes as removing them one
+# pattern at a time, in a single pass
+_LEADING_NOISE = re.compile(
+    "^" + "".join(f"(?:{pattern})?" for pattern in _EXPLANATION_STARTS + _TRANSITIONS),
+    re.IGNORECASE,
+)
+
+# Closing quote followed by more words (likely explanation)
+_QUOTE_TAIL = re.compile(r'["\'][\s.!?]+\w')
+
+# Explanation keywords following the translation
+_EXPLANATION_KW = re.compile(r'[\s.!?]+(This|You|It|The|Sure|Here|I|That)\s')
+
+# Period/question mark followed by any capital letter
+_CAP_AFTER_PUNCT = re.compile(r'[.!?]\s+[A-Z]')
+
 
 class TranslationClient:
     def __init__(self, model_path=None):
@@ -24,6 +77,15 @@ class TranslationClient:
 
         print(f"Loading translation model from {self.model_path}...")
         self.model, self.tokenizer = load(str(self.model_path))
+
+        # Tokenize the fixed prompt text once; each call only encodes the input
+        self._prompt_ids = {
+            pair: (
+                self.tokenizer.encode(prefix),
+                self.tokenizer.encode(suffix, add_special_tokens=False),
+            )
+            for pair, (prefix, suffix) in _PROMPTS.items()
+        }
         print("Translation model loaded!")
 
     def translate(self, text, source_lang="es", target_lang="en"):
@@ -38,18 +100,13 @@ class TranslationClient:
         Returns:
             Translated text
         """
-        # Be VERY explicit about what language the input is in
-        if source_lang == "es" and target_lang == "en":
-            prompt = f"""Translate this Spanish to English: "{text}"
-
-English translation:"""
-        elif source_lang == "en" and target_lang == "es":
-            prompt = f"""Translate this English to Spanish: "{text}"
-
-Spanish translation:"""
-        else:
+        prompt_ids = self._prompt_ids.get((source_lang, target_lang))
+        if prompt_ids is None:
             raise ValueError(f"Unsupported language pair: {source_lang} -> {target_lang}")
 
+        prefix_ids, suffix_ids = prompt_ids
+        prompt = prefix_ids + self.tokenizer.encode(text, add_special_tokens=False) + suffix_ids
+
         # Generate translation
         response = generate(
             self.model,
@@ -62,13 +119,12 @@ Spanish translation:"""
         # Extract just the translation (remove prompt echo and explanations)
         translation = response.strip()
 
-        import re
-
         # If the model is complaining about misspellings or errors, try to extract intent
         # Pattern: "seems to contain..." or "appears to have..." - just do best effort translation
-        if 'misspelling' in translation.lower() or 'non-standard' in translation.lower() or 'unclear' in translation.lower():
+        lowered = translation.lower()
+        if 'misspelling' in lowered or 'non-standard' in lowered or 'unclear' in lowered:
             # Try to extract any quoted translation attempt
-            quote_match = re.search(r'"([^"]+)"', translation)
+            quote_match = _QUOTED.search(translation)
             if quote_match:
                 translation = quote_match.group(1)
             else:
@@ -81,64 +137,37 @@ Spanish translation:"""
                     else:
                         translation = "Yo quiero aprender español, por favor"
 
-        # Remove common explanation patterns that start the response
-        explanation_starts = [
-            r'^The given Spanish text\s+"[^"]*"?\s*',
-            r'^The given English text\s+"[^"]*"?\s*',
-            r'^The Spanish text\s+"[^"]*"?\s*',
-            r'^The English text\s+"[^"]*"?\s*',
-            r'^This Spanish text\s+"[^"]*"?\s*',
-            r'^This English text\s+"[^"]*"?\s*',
-            r'^Spanish translation:\s*',
-            r'^English translation:\s*',
-        ]
-
-        for pattern in explanation_starts:
-            translation = re.sub(pattern, '', translation, flags=re.IGNORECASE)
-
-        # Remove transition phrases like "translates to X as:", "means:", etc.
-        transition_patterns = [
-            r'^translates? to \w+ as:\s*',
-            r'^means:\s*',
-            r'^is:\s*',
-            r'^says:\s*',
-            r'^seems to\s+.*?[.!?]\s*',
-            r'^appears to\s+.*?[.!?]\s*',
-        ]
-
-        for pattern in transition_patterns:
-            translation = re.sub(pattern, '', translation, flags=re.IGNORECASE)
+        # Remove explanation patterns and transition phrases at the start
+        translation = _LEADING_NOISE.sub('', translation, count=1)
 
         # First, strip any leading/trailing quotes
         translation = translation.strip('"\'').strip()
 
         # If there's a closing quote followed by more text, cut it there
         # Pattern: quote followed by space and more words (likely explanation)
-        match = re.search(r'["\'][\s.!?]+\w', translation)
+        match = _QUOTE_TAIL.search(translation)
         if match:
             translation = translation[:match.start()].strip()
 
         # Remove anything after explanation keywords
-        pattern = r'[\s.!?]+(This|You|It|The|Sure|Here|I|That)\s'
-        match = re.search(pattern, translation)
+        match = _EXPLANATION_KW.search(translation)
         if match:
             translation = translation[:match.start()].strip()
 
         # Also check for period/question mark followed by ANY capital letter
         if not match:
-            match = re.search(r'[.!?]\s+[A-Z]', translation)
+            match = _CAP_AFTER_PUNCT.search(translation)
             if match:
                 translation = translation[:match.start() + 1].strip()
 
-        # Final cleanup
-        translation = ' '.join(translation.split()).strip()
+        # Final cleanup (joining the split words already trims the ends)
+        translation = ' '.join(translation.split())
         translation = translation.strip('"\'').strip()  # Remove any remaining quotes
 
         # If the translation appears to repeat itself, take only the first occurrence
-        # Split by closing quote + opening quote pattern
+        # Cut at the first closing quote + opening quote
         if '?" "' in translation or '." "' in translation:
-            translation = translation.split('" "')[0].strip()
-            translation = translation.strip('"').strip()
+            translation = translation.partition('" "')[0].strip().strip('"').strip()
 
         return translation
 
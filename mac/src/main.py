@@ -5,14 +5,14 @@ Exposes WebSocket endpoint for remote access via Cloudflare Tunnel.
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 import asyncio
-import json
+import subprocess
 import tempfile
 from pathlib import Path
-import base64
 from datetime import datetime
 import gc
 
 from translation_service import TranslationService
+from wire_codecs import b64decode, b64encode, json_dumps, json_loads
 from streaming_translation_service import StreamingTranslationService
 from stt.whisper_client import WhisperClient
 from llm.translation_factory import create_translation_client
@@ -79,17 +79,25 @@ async def websocket_translate(websocket: WebSocket):
         "audio": "<base64-encoded audio data>",
         "source_lang": "es" | "en",
         "target_lang": "en" | "es",
-        "format": "wav" | "mp3" | "ogg"
+        "format": "wav" | "mp3" | "ogg",
+        "request_id": "<optional, echoed back in the response>"
     }
 
     Server responds: {
         "status": "success" | "error",
+        "request_id": "<request_id from the request, if given>",
         "transcription": "<original text>",
         "translation": "<translated text>",
         "audio": "<base64-encoded translated audio>",
         "latency_ms": <int>,
         "error": "<error message if status=error>"
     }
+
+    Binary mode (no base64): the client omits "audio" and instead sets
+    "audio_bytes": <int>, then sends the raw audio as a binary frame.
+    On success the server replies with the same JSON minus "audio", plus
+    "audio_bytes": <int>, followed by the translated audio as a binary frame.
+    Error responses are a single JSON message in both modes.
     """
     await websocket.accept()
     print(f"✓ WebSocket client connected from {websocket.client}")
@@ -98,15 +106,20 @@ async def websocket_translate(websocket: WebSocket):
         while True:
             # Receive message
             data = await websocket.receive_text()
-            request = json.loads(data)
+            request = json_loads(data)
 
             print(f"\n{'='*60}")
             print(f"📥 Translation request: {request.get('source_lang')} → {request.get('target_lang')}")
             start_time = asyncio.get_event_loop().time()
 
             try:
-                # Decode audio
-                audio_data = base64.b64decode(request["audio"])
+                # Read audio from the following binary frame, or decode legacy base64
+                binary_mode = "audio" not in request
+                if binary_mode:
+                    audio_data = await websocket.receive_bytes()
+                else:
+                    # Whole-file payloads are large; keep the event loop free
+                    audio_data = await asyncio.to_thread(b64decode, request["audio"])
                 audio_format = request.get("format", "wav")
 
                 # Save to temp file
@@ -116,7 +129,6 @@ async def websocket_translate(websocket: WebSocket):
 
                 # Convert to WAV if needed (Whisper requires WAV)
                 if audio_format != "wav":
-                    import subprocess
                     wav_path = temp_audio_path.replace(f".{audio_format}", ".wav")
                     subprocess.run([
                         "ffmpeg", "-i", temp_audio_path,
@@ -136,10 +148,9 @@ async def websocket_translate(websocket: WebSocket):
                     target_lang=request["target_lang"]
                 )
 
-                # Read output audio and encode
+                # Read output audio
                 with open(result["output_audio"], "rb") as f:
                     output_audio_data = f.read()
-                output_audio_b64 = base64.b64encode(output_audio_data).decode('utf-8')
 
                 # Calculate latency
                 latency_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
@@ -147,9 +158,9 @@ async def websocket_translate(websocket: WebSocket):
                 # Send response
                 response = {
                     "status": "success",
+                    "request_id": request.get("request_id"),
                     "transcription": result["transcription"],
                     "translation": result["translation"],
-                    "audio": output_audio_b64,
                     "latency_ms": latency_ms
                 }
 
@@ -157,7 +168,13 @@ async def websocket_translate(websocket: WebSocket):
                 print(f"   Original: {result['transcription'][:50]}...")
                 print(f"   Translated: {result['translation'][:50]}...")
 
-                await websocket.send_text(json.dumps(response))
+                if binary_mode:
+                    response["audio_bytes"] = len(output_audio_data)
+                    await websocket.send_text(json_dumps(response))
+                    await websocket.send_bytes(output_audio_data)
+                else:
+                    response["audio"] = await asyncio.to_thread(b64encode, output_audio_data)
+                    await websocket.send_text(json_dumps(response))
 
                 # Cleanup temp files BEFORE deleting result
                 temp_audio_file = Path(temp_audio_path)
@@ -168,7 +185,6 @@ async def websocket_translate(websocket: WebSocket):
                 # Explicitly delete large variables to free memory
                 del audio_data
                 del output_audio_data
-                del output_audio_b64
                 del response
                 del result
 
@@ -179,8 +195,9 @@ async def websocket_translate(websocket: WebSocket):
                 error_msg = str(e)
                 print(f"❌ Translation error: {error_msg}")
 
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(json_dumps({
                     "status": "error",
+                    "request_id": request.get("request_id"),
                     "error": error_msg
                 }))
 
@@ -233,7 +250,7 @@ async def websocket_stream(websocket: WebSocket):
         while True:
             # Receive message
             data = await websocket.receive_text()
-            request = json.loads(data)
+            request = json_loads(data)
 
             print(f"\n{'='*60}")
             print(f"📥 Streaming translation: {request.get('source_lang')} → {request.get('target_lang')}")
@@ -241,7 +258,7 @@ async def websocket_stream(websocket: WebSocket):
 
             try:
                 # Decode audio
-                audio_data = base64.b64decode(request["audio"])
+                audio_data = b64decode(request["audio"])
                 audio_format = request.get("format", "wav")
                 streaming_interval = request.get("streaming_interval", 2.0)
 
@@ -252,7 +269,6 @@ async def websocket_stream(websocket: WebSocket):
 
                 # Convert to WAV if needed (Whisper requires WAV)
                 if audio_format != "wav":
-                    import subprocess
                     wav_path = temp_audio_path.replace(f".{audio_format}", ".wav")
                     subprocess.run([
                         "ffmpeg", "-i", temp_audio_path,
@@ -275,7 +291,7 @@ async def websocket_stream(websocket: WebSocket):
                 ):
                     if result["type"] == "metadata":
                         # Send metadata (transcription + translation)
-                        await websocket.send_text(json.dumps({
+                        await websocket.send_text(json_dumps({
                             "type": "metadata",
                             "transcription": result["transcription"],
                             "translation": result["translation"]
@@ -285,8 +301,8 @@ async def websocket_stream(websocket: WebSocket):
 
                     elif result["type"] == "audio_chunk":
                         # Send audio chunk
-                        audio_b64 = base64.b64encode(result["data"]).decode('utf-8')
-                        await websocket.send_text(json.dumps({
+                        audio_b64 = b64encode(result["data"])
+                        await websocket.send_text(json_dumps({
                             "type": "audio_chunk",
                             "data": audio_b64,
                             "chunk_index": result["chunk_index"]
@@ -298,7 +314,7 @@ async def websocket_stream(websocket: WebSocket):
                 latency_ms = int((asyncio.get_event_loop().time() - start_time) * 1000)
 
                 # Send completion message
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(json_dumps({
                     "type": "complete",
                     "total_chunks": chunk_count,
                     "latency_ms": latency_ms
@@ -313,7 +329,7 @@ async def websocket_stream(websocket: WebSocket):
                 error_msg = str(e)
                 print(f"❌ Streaming translation error: {error_msg}")
 
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(json_dumps({
                     "type": "error",
                     "error": error_msg
                 }))
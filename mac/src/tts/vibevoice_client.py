@@ -234,7 +234,8 @@ class VibeVoiceClient(TTSProvider):
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_np.tobytes())
+            # Write straight from the array's buffer (tobytes() would copy it first)
+            wav_file.writeframes(np.ascontiguousarray(audio_np))
 
         return wav_buffer.getvalue()
 
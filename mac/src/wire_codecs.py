@@ -0,0 +1,46 @@
+"""
+Codecs for audio and messages on the WebSocket wire, using faster
+drop-in libraries when they are installed.
+"""
+import json
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib base64 codec
+    import pybase64 as base64
+except ImportError:
+    import base64
+try:
+    # C JSON codec; orjson emits bytes, but WebSocket messages go out as
+    # text frames, so json_dumps returns str and json_dumpb bytes
+    import orjson
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_dumpb = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+
+    def json_dumpb(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
+
+
+def b64decode(data: str) -> bytes:
+    """
+    Decode base64 audio, strict first.
+
+    Strict validation is pybase64's fast path (lenient mode pre-filters the
+    input); anything that fails it is retried leniently, like the stdlib default.
+    """
+    try:
+        return base64.b64decode(data, validate=True)
+    except ValueError:
+        return base64.b64decode(data, validate=False)
+
+
+def b64encode(data: bytes) -> str:
+    """Encode audio as base64 text."""
+    return base64.b64encode(data).decode("ascii")
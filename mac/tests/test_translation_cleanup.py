@@ -0,0 +1,77 @@
+"""
+Tests for the MLX translation client's output cleanup patterns.
+Checks that the fused leading-noise regex strips exactly what applying
+each explanation/transition pattern in turn would.
+"""
+
+import importlib.util
+import random
+import re
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# The patterns are plain regexes; only TranslationClient needs mlx_lm, which
+# is Apple Silicon only, so a placeholder lets them be tested anywhere
+if importlib.util.find_spec("mlx_lm") is None:
+    mlx_lm = types.ModuleType("mlx_lm")
+    mlx_lm.load = mlx_lm.generate = None
+    sys.modules["mlx_lm"] = mlx_lm
+
+from llm.translation_client import _EXPLANATION_STARTS, _LEADING_NOISE, _TRANSITIONS
+
+# Fragments that build responses matching several prefixes in a row
+FRAGMENTS = [
+    'The given Spanish text "hola" ',
+    'the english text "hi" ',
+    'This Spanish text "sin cierre ',
+    "Spanish translation: ",
+    "English translation:",
+    "translates to English as: ",
+    "translate to Spanish as:",
+    "means: ",
+    "IS: ",
+    "says:",
+    "seems to be a greeting. ",
+    "appears to say hello! ",
+    "Hello, how are you?",
+    '"Good morning"',
+    "is",
+    " ",
+]
+
+
+def _strip_sequentially(text: str) -> str:
+    """Reference: remove each anchored pattern in list order."""
+    for pattern in _EXPLANATION_STARTS + _TRANSITIONS:
+        text = re.sub("^" + pattern, "", text, flags=re.IGNORECASE)
+    return text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Hello there", "Hello there"),
+        ("English translation: Hello there", "Hello there"),
+        ('The given Spanish text "hola" means: hello', "hello"),
+        ("means: hello. This is a greeting.", "hello. This is a greeting."),
+        ("seems to be Spanish. Hello", "Hello"),
+        # Patterns only apply in list order, once each
+        ("means: English translation: hi", "English translation: hi"),
+        ("", ""),
+    ],
+)
+def test_leading_noise_examples(text, expected):
+    assert _LEADING_NOISE.sub("", text, count=1) == expected
+
+
+def test_leading_noise_matches_sequential_removal():
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 5)))
+        assert _LEADING_NOISE.sub("", text, count=1) == _strip_sequentially(text), text
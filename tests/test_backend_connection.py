@@ -0,0 +1,131 @@
+"""
+Tests for request_id multiplexing on the shared Mac backend connection.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add cloud/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "cloud" / "src"))
+
+pytest.importorskip("websockets")
+
+import backend_connection
+from backend_connection import BackendConnection
+
+
+class FakeBackend:
+    """In-memory stand-in for the Mac backend's WebSocket."""
+
+    def __init__(self):
+        self.requests: asyncio.Queue = asyncio.Queue()
+        self._replies: asyncio.Queue = asyncio.Queue()
+        self._header = None
+        self.closed = False
+
+    async def send(self, message):
+        if isinstance(message, str):
+            self._header = json.loads(message)
+        else:
+            await self.requests.put((self._header, message))
+
+    async def recv(self):
+        return await self._replies.get()
+
+    async def close(self):
+        self.closed = True
+
+    def reply(self, header: dict, audio: bytes = None):
+        """Queue a response header, followed by its binary audio frame."""
+        self._replies.put_nowait(json.dumps(header))
+        if audio is not None:
+            self._replies.put_nowait(audio)
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    fake = FakeBackend()
+
+    async def fake_connect(url):
+        return fake
+
+    monkeypatch.setattr(backend_connection, "_ws_connect", fake_connect)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_responses_matched_by_request_id(fake_backend):
+    conn = BackendConnection("ws://backend")
+    first = asyncio.create_task(conn.translate({"source_lang": "es"}, b"one"))
+    second = asyncio.create_task(conn.translate({"source_lang": "en"}, b"two"))
+
+    header_one, audio_one = await fake_backend.requests.get()
+    header_two, audio_two = await fake_backend.requests.get()
+    assert header_one["request_id"] != header_two["request_id"]
+    assert header_one["audio_bytes"] == len(audio_one)
+
+    # Answer out of order
+    fake_backend.reply({"status": "success", "request_id": header_two["request_id"]}, b"TWO")
+    fake_backend.reply({"status": "success", "request_id": header_one["request_id"]}, b"ONE")
+
+    assert (await first)[1] == b"ONE"
+    assert (await second)[1] == b"TWO"
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_response_without_request_id_is_dropped(fake_backend):
+    conn = BackendConnection("ws://backend")
+    request = asyncio.create_task(conn.translate({}, b"audio"))
+    header, _ = await fake_backend.requests.get()
+
+    fake_backend.reply({"status": "error", "error": "stray"})
+    await asyncio.sleep(0.01)
+    assert not request.done()
+
+    fake_backend.reply({"status": "error", "error": "mine", "request_id": header["request_id"]})
+    response, audio = await request
+    assert response["error"] == "mine"
+    assert audio is None
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_late_reply_for_abandoned_request(fake_backend):
+    conn = BackendConnection("ws://backend")
+    abandoned = asyncio.create_task(conn.translate({}, b"slow"))
+    abandoned_header, _ = await fake_backend.requests.get()
+    abandoned.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await abandoned
+
+    request = asyncio.create_task(conn.translate({}, b"next"))
+    header, _ = await fake_backend.requests.get()
+
+    # The abandoned request's reply arrives first and must not be taken
+    # for the next one's
+    fake_backend.reply({"status": "success", "request_id": abandoned_header["request_id"]}, b"OLD")
+    fake_backend.reply({"status": "success", "request_id": header["request_id"]}, b"NEW")
+
+    assert (await request)[1] == b"NEW"
+    assert not fake_backend.closed
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_unanswered_request_times_out(fake_backend):
+    conn = BackendConnection("ws://backend")
+    conn.RESPONSE_TIMEOUT_S = 0.05
+    request = asyncio.create_task(conn.translate({}, b"audio"))
+    await fake_backend.requests.get()
+
+    # A reply that never names the request doesn't count
+    fake_backend.reply({"status": "error", "error": "stray"})
+    with pytest.raises(TimeoutError):
+        await request
+    assert not conn._pending
+    await conn.close()
@@ -0,0 +1,77 @@
+"""
+Tests for the built-in .env parser used by the CLI's config commands.
+"""
+
+from levi_cli.core.config_manager import _cached_dotenv, _parse_env
+
+
+def _parse(tmp_path, text: str) -> dict:
+    env_path = tmp_path / ".env"
+    env_path.write_text(text)
+    return _parse_env(env_path)
+
+
+def test_key_value_lines(tmp_path):
+    assert _parse(tmp_path, "A=1\nB = two \nC=\n") == {"A": "1", "B": "two", "C": ""}
+
+
+def test_comments_and_blank_lines(tmp_path):
+    text = "# heading\n\n   # indented comment\nA=1\n"
+    assert _parse(tmp_path, text) == {"A": "1"}
+
+
+def test_inline_comments_need_whitespace(tmp_path):
+    text = "A=value # note\nB=value\t# note\nC=value#not-a-comment\n"
+    assert _parse(tmp_path, text) == {
+        "A": "value",
+        "B": "value",
+        "C": "value#not-a-comment",
+    }
+
+
+def test_quoted_values(tmp_path):
+    text = (
+        "A=\"double # not a comment\"\n"
+        "B='single'\n"
+        "C=\"  padded  \" # comment\n"
+        "D=\"unterminated\n"
+        "E=\"a=b\"\n"
+    )
+    assert _parse(tmp_path, text) == {
+        "A": "double # not a comment",
+        "B": "single",
+        "C": "  padded  ",
+        "D": "unterminated",
+        "E": "a=b",
+    }
+
+
+def test_export_prefix(tmp_path):
+    assert _parse(tmp_path, "export A=1\nexport   B=2\n") == {"A": "1", "B": "2"}
+
+
+def test_lines_without_equals_are_skipped(tmp_path):
+    assert _parse(tmp_path, "JUST_A_KEY\nA=1\n") == {"A": "1"}
+
+
+def test_later_keys_win(tmp_path):
+    assert _parse(tmp_path, "A=1\nA=2\n") == {"A": "2"}
+
+
+def test_windows_line_endings(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_bytes(b"A=1\r\nB='2'\r\n")
+    assert _parse_env(env_path) == {"A": "1", "B": "2"}
+
+
+def test_cached_dotenv(tmp_path):
+    env_path = tmp_path / ".env"
+    assert _cached_dotenv(env_path) is None
+
+    env_path.write_text("A=1\n")
+    first = _cached_dotenv(env_path)
+    assert first == {"A": "1"}
+    assert _cached_dotenv(env_path) is first
+
+    env_path.write_text("A=1\nB=22\n")
+    assert _cached_dotenv(env_path) == {"A": "1", "B": "22"}
@@ -0,0 +1,76 @@
+"""
+Tests for LogManager's tail reading, which must return the same lines as
+readlines() on the whole file.
+"""
+
+import io
+
+import pytest
+
+from levi_cli.core.log_manager import LogManager
+
+CONTENTS = [
+    "",
+    "\n",
+    "one line without newline",
+    "first\nsecond\nthird\n",
+    "first\nsecond\nthird",
+    "blank\n\n\nlines\n\n",
+    "windows\r\nline\r\nendings\r\n",
+    "old mac\rline\rendings\r",
+    "mixed\r\nendings\rhere\nñandú ✓\r\n\r",
+    "long " * 50 + "\n" + "line\n" * 20,
+]
+
+
+def _readlines(text: str) -> list[str]:
+    """Lines as text-mode readlines() would return them."""
+    return io.TextIOWrapper(io.BytesIO(text.encode()), encoding="utf-8").readlines()
+
+
+@pytest.fixture(params=[1, 3, 8192], ids=lambda size: f"block{size}")
+def manager(tmp_path, request):
+    """LogManager over tmp_path, with block sizes that split line endings."""
+    manager = LogManager(tmp_path)
+    manager.TAIL_BLOCK_SIZE = request.param
+    return manager
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+@pytest.mark.parametrize("lines", [1, 2, 3, 5, 100])
+def test_tail_matches_readlines(manager, content, lines):
+    manager.get_log_path("test").write_bytes(content.encode())
+
+    assert manager.tail("test", lines) == _readlines(content)[-lines:]
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+@pytest.mark.parametrize("lines", [1, 2, 3, 5, 100])
+def test_copy_tail_matches_readlines(manager, tmp_path, content, lines):
+    manager.get_log_path("test").write_bytes(content.encode())
+
+    # A real file exercises os.sendfile(); BytesIO has no descriptor and
+    # falls back to block copies
+    with open(tmp_path / "out", "wb") as out:
+        assert manager.copy_tail("test", lines, out)
+    buffered = io.BytesIO()
+    assert manager.copy_tail("test", lines, buffered)
+
+    expected = _readlines(content)[-lines:]
+    assert _readlines((tmp_path / "out").read_bytes().decode()) == expected
+    assert _readlines(buffered.getvalue().decode()) == expected
+
+
+def test_tail_zero_lines(manager):
+    manager.get_log_path("test").write_text("a\nb\n")
+
+    assert manager.tail("test", 0) == []
+
+    out = io.BytesIO()
+    assert manager.copy_tail("test", 0, out)
+    assert out.getvalue() == b""
+
+
+def test_missing_log(manager):
+    assert manager.tail("missing", 10) == []
+    assert not manager.copy_tail("missing", 10, io.BytesIO())
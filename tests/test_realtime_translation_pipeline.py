@@ -0,0 +1,106 @@
+"""
+Tests for the realtime pipeline's audio ring buffer.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add cloud/src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "cloud" / "src"))
+
+pytest.importorskip("webrtcvad")
+pytest.importorskip("websockets")
+
+import realtime_translation_pipeline
+from realtime_translation_pipeline import FRAME_BYTES, RealtimeTranslationPipeline
+
+RING_FRAMES = 4
+CAPACITY = FRAME_BYTES * RING_FRAMES
+
+
+class FakeSpeechGate:
+    """Counts resets instead of running Silero."""
+
+    def __init__(self):
+        self.resets = 0
+
+    def is_speech(self, frame: bytes) -> bool:
+        return True
+
+    def reset(self):
+        self.resets += 1
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    # A small ring, so tests wrap it quickly
+    monkeypatch.setattr(realtime_translation_pipeline, "RING_FRAMES", RING_FRAMES)
+    return RealtimeTranslationPipeline("ws://backend", backend=object())
+
+
+def _random_bytes(rng: random.Random, size: int) -> bytes:
+    return bytes(rng.getrandbits(8) for _ in range(size))
+
+
+def test_ring_keeps_latest_audio(pipeline):
+    rng = random.Random(0)
+    stream = b""
+    for _ in range(200):
+        # Mostly frame-sized chunks, with odd sizes and ring-overfilling ones
+        size = rng.choice([FRAME_BYTES, FRAME_BYTES, 1, 333, CAPACITY - 1, CAPACITY + 77])
+        chunk = _random_bytes(rng, size)
+        pipeline._buffer_audio(chunk)
+        stream += chunk
+
+        assert bytes(pipeline._read_buffer()) == stream[-CAPACITY:]
+        assert pipeline._buffered == min(len(stream), CAPACITY)
+        assert pipeline._written == len(stream)
+
+
+def test_ring_slice_follows_stream_offsets(pipeline):
+    rng = random.Random(1)
+    stream = b""
+    for _ in range(50):
+        chunk = _random_bytes(rng, rng.randrange(1, CAPACITY))
+        pipeline._buffer_audio(chunk)
+        stream += chunk
+
+        # Any span still held in the ring, including ones that wrap its end
+        oldest = max(0, len(stream) - CAPACITY)
+        offset = rng.randrange(oldest, len(stream))
+        size = rng.randrange(0, len(stream) - offset + 1)
+        assert bytes(pipeline._ring_slice(offset, size)) == stream[offset:offset + size]
+
+
+@pytest.mark.asyncio
+async def test_translate_speech_resets_ring_and_gate(pipeline):
+    sent = []
+
+    async def fake_call_backend(wav_data):
+        sent.append(bytes(wav_data))
+        return None
+
+    pipeline._call_backend = fake_call_backend
+    pipeline.speech_gate = gate = FakeSpeechGate()
+    pipeline._gate_open = True
+
+    audio = bytes(range(256)) * 10
+    pipeline._buffer_audio(audio)
+    await pipeline.translate_speech()
+
+    # The backend got the buffered audio as a WAV payload
+    assert len(sent) == 1
+    assert sent[0].endswith(audio)
+    assert sent[0].startswith(b"RIFF")
+
+    assert bytes(pipeline._read_buffer()) == b""
+    assert pipeline._written == 0
+    assert not pipeline._gate_open
+    assert gate.resets == 1
+
+    # Writing after a reset starts a fresh stream
+    pipeline._buffer_audio(b"\x01\x02")
+    assert bytes(pipeline._read_buffer()) == b"\x01\x02"